@@ -0,0 +1,38 @@
+"""
+Benchmark of the per-item cost of retrieving parts of an iterator using
+:obj:`parts.parts.parts` with a length parameter, comparing lazy parts (that
+are consumed as they are retrieved) with materialized parts.
+
+.. code-block:: bash
+
+    python benchmarks/materialize.py --size 1000000 --length 64
+"""
+import argparse
+import time
+from collections import deque
+
+from parts import parts
+
+def main():
+    """
+    Retrieve and consume every part of an iterator for each mode and report
+    the elapsed time per item.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=10 ** 6)
+    parser.add_argument('--length', type=int, default=64)
+    args = parser.parse_args()
+
+    for (label, options) in (
+            ('lazy', {}),
+            ('tuple', {'materialize': tuple}),
+            ('list', {'materialize': list})
+        ):
+        start = time.perf_counter()
+        for part in parts(iter(range(args.size)), length=args.length, **options):
+            deque(part, maxlen=0)
+        elapsed = time.perf_counter() - start
+        print(label + ': ' + '%.1f' % (elapsed / args.size * 10 ** 9) + 'ns per item')
+
+if __name__ == '__main__':
+    main()
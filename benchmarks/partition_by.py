@@ -0,0 +1,45 @@
+"""
+Benchmark of the throughput of :obj:`parts.buckets.partition_by` on a stream
+of generated records. The stream is never held in memory, so the number of
+records can be chosen such that the total size of the records exceeds the
+available memory (in which case most items are moved to temporary files).
+
+.. code-block:: bash
+
+    python benchmarks/partition_by.py --size 100000000 --number 64 --limit 1000000
+"""
+import argparse
+import time
+
+from parts.buckets import partition_by
+
+def main():
+    """
+    Partition generated records by key and then read every bucket, reporting
+    the throughput of each phase.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=10 ** 6)
+    parser.add_argument('--number', type=int, default=16)
+    parser.add_argument('--limit', type=int, default=10 ** 5)
+    parser.add_argument('--directory', type=str, default=None)
+    args = parser.parse_args()
+
+    records = (('key' + str(i % 10007), i, 'x' * 64) for i in range(args.size))
+
+    start = time.perf_counter()
+    buckets = partition_by(
+        records, lambda record: record[0], args.number,
+        limit=args.limit, directory=args.directory
+    )
+    elapsed = time.perf_counter() - start
+    print('partition: ' + '%.0f' % (args.size / elapsed) + ' items/s')
+
+    start = time.perf_counter()
+    count = sum(1 for bucket in buckets for _ in bucket)
+    elapsed = time.perf_counter() - start
+    print('read: ' + '%.0f' % (count / elapsed) + ' items/s')
+    print('spilled buckets: ' + str(sum(bucket.spilled for bucket in buckets)))
+
+if __name__ == '__main__':
+    main()
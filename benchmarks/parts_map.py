@@ -0,0 +1,54 @@
+"""
+Benchmark comparing :obj:`parts.parallel.parts_map` with the naive submission
+of the parts of a :obj:`bytes` instance to a process pool (in which case each
+part is pickled and sent to a worker process).
+
+.. code-block:: bash
+
+    python benchmarks/parts_map.py --size 268435456 --number 64
+"""
+import argparse
+import os
+import time
+import zlib
+import concurrent.futures
+
+from parts import parts, parts_map
+
+def naive(data: bytes, number: int, executor: concurrent.futures.Executor) -> list:
+    """
+    Submit every part to the executor and collect the results in order.
+    """
+    futures = [executor.submit(zlib.crc32, part) for part in parts(data, number)]
+    return [future.result() for future in futures]
+
+def shared(data: bytes, number: int, executor: concurrent.futures.Executor) -> list:
+    """
+    Use :obj:`parts.parallel.parts_map` (which passes shared memory handles and
+    offsets to the workers).
+    """
+    return list(parts_map(zlib.crc32, data, number, executor=executor))
+
+def main():
+    """
+    Run both approaches and report the elapsed time for each.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=2 ** 26)
+    parser.add_argument('--number', type=int, default=32)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    data = os.urandom(args.size)
+    with concurrent.futures.ProcessPoolExecutor(args.workers) as executor:
+        list(executor.map(abs, range(args.workers))) # Start the workers.
+        results = {}
+        for approach in (naive, shared):
+            start = time.perf_counter()
+            results[approach.__name__] = approach(data, args.number, executor)
+            print(approach.__name__ + ': ' + '%.3f' % (time.perf_counter() - start) + 's')
+
+    assert results['naive'] == results['shared']
+
+if __name__ == '__main__':
+    main()
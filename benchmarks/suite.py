@@ -0,0 +1,194 @@
+"""
+Benchmark suite for :obj:`parts.parts.parts` that covers every branch (number
+of parts, a single part length, an iterable of part lengths, and both a number
+of parts and part lengths) for every built-in input type (as well as a custom
+:obj:`~collections.abc.Sequence` and a generator) at a range of sizes, along
+with the time required to import the library.
+
+Results are written as JSON and can be compared with the results of an
+earlier run (such as one for the previous release) to detect regressions.
+
+.. code-block:: bash
+
+    python benchmarks/suite.py --output baseline.json
+    python benchmarks/suite.py --baseline baseline.json --tolerance 0.25
+    python benchmarks/suite.py --sizes 10 1000 100000 100000000 --inputs list bytes
+
+The largest sizes (such as ``10 ** 8``) require several gigabytes of memory for
+some input types, so they are only included when requested.
+"""
+import argparse
+import collections.abc
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from collections import deque
+
+from parts import parts
+
+class Custom(collections.abc.Sequence):
+    """
+    Minimal user-defined sequence type (whose slices are also instances of
+    this type).
+    """
+    def __init__(self, items):
+        self.items = items
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return Custom(self.items[key])
+        return self.items[key]
+
+# Functions that prepare an input of the specified size and return a function
+# that supplies that input to each benchmark run (generators must be created
+# anew for every run).
+INPUTS = {
+    'list': lambda size: (lambda items: lambda: items)(list(range(size))),
+    'tuple': lambda size: (lambda items: lambda: items)(tuple(range(size))),
+    'str': lambda size: (lambda items: lambda: items)('x' * size),
+    'bytes': lambda size: (lambda items: lambda: items)(bytes(size)),
+    'bytearray': lambda size: (lambda items: lambda: items)(bytearray(size)),
+    'range': lambda size: lambda: range(size),
+    'custom': lambda size: (lambda items: lambda: items)(Custom(list(range(size)))),
+    'generator': lambda size: lambda: (i for i in range(size))
+}
+
+# Functions that return the arguments for each branch of the function given the
+# size of the input (so that there are ten parts).
+BRANCHES = {
+    'number': lambda size: {'number': 10},
+    'length': lambda size: {'length': max(1, size // 10)},
+    'lengths': lambda size: {'length': [max(1, size // 10)] * 10},
+    'number+length': lambda size: {'number': 10, 'length': max(1, size // 10)},
+    'number+lengths': lambda size: {'number': 10, 'length': [max(1, size // 10)] * 10}
+}
+
+def consume(iterable, arguments: dict):
+    """
+    Retrieve every part (and every item of any lazy part).
+    """
+    for part in parts(iterable, **arguments):
+        if not isinstance(part, collections.abc.Sized):
+            deque(part, maxlen=0)
+
+def measure(function, repeat: int) -> float:
+    """
+    Return the smallest time (in seconds) per invocation of a function across
+    the specified number of repetitions.
+    """
+    timer = timeit.Timer(function)
+    (number, _) = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+def imports(repeat: int) -> dict:
+    """
+    Measure the time (in seconds) required to import the library in a new
+    interpreter and determine which notable modules the import loads.
+    """
+    environment = dict(os.environ)
+    source = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+    environment['PYTHONPATH'] = os.pathsep.join(
+        [source] + ([environment['PYTHONPATH']] if 'PYTHONPATH' in environment else [])
+    )
+
+    seconds = []
+    for _ in range(repeat):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import parts'],
+            env=environment, capture_output=True, text=True, check=True
+        )
+        line = [l for l in process.stderr.splitlines() if l.rstrip().endswith('| parts')][-1]
+        seconds.append(int(line.split('|')[1]) / 1000000)
+
+    process = subprocess.run(
+        [
+            sys.executable, '-c',
+            'import sys, parts; ' + \
+            'print(",".join(m for m in ("doctest", "numpy") if m in sys.modules))'
+        ],
+        env=environment, capture_output=True, text=True, check=True
+    )
+    loaded = [module for module in process.stdout.strip().split(',') if module != '']
+    return {'seconds': min(seconds), 'loaded': loaded}
+
+def run(sizes: list, inputs: list, branches: list, repeat: int) -> dict:
+    """
+    Run every combination of input type, size, and branch, returning the
+    time per invocation for each combination (keyed by a descriptive name).
+    """
+    results = {}
+    for size in sizes:
+        for name in inputs:
+            supply = INPUTS[name](size)
+            for branch in branches:
+                if name == 'generator' and branch.startswith('number'):
+                    continue # Objects without a length only support lengths.
+                arguments = BRANCHES[branch](size)
+                key = '/'.join([branch, name, str(size)])
+                results[key] = measure(lambda: consume(supply(), arguments), repeat)
+                print(key + ': ' + '%.3e' % results[key] + 's', file=sys.stderr)
+            del supply
+    return results
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Print the ratio of each result to the corresponding baseline result and
+    return the names of the results that exceed the tolerance.
+    """
+    regressions = []
+    for (key, seconds) in sorted(results.items()):
+        if key not in baseline:
+            continue
+        ratio = seconds / baseline[key]
+        flag = ''
+        if ratio > 1 + tolerance:
+            (flag, regressions) = (' (regression)', regressions + [key])
+        print(key + ': ' + '%.2f' % ratio + 'x baseline' + flag)
+    return regressions
+
+def main():
+    """
+    Run the suite, write the results, and compare them with a baseline (if
+    one is supplied), exiting with a nonzero status if any result regressed.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 100000])
+    parser.add_argument('--inputs', nargs='+', choices=list(INPUTS), default=list(INPUTS))
+    parser.add_argument('--branches', nargs='+', choices=list(BRANCHES), default=list(BRANCHES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', type=str, default=None)
+    parser.add_argument('--baseline', type=str, default=None)
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'import': imports(args.repeat),
+        'results': run(args.sizes, args.inputs, args.branches, args.repeat)
+    }
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(output + '\n')
+
+    if args.baseline is not None:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        regressions = compare(report['results'], baseline['results'], args.tolerance)
+        ratio = report['import']['seconds'] / baseline['import']['seconds']
+        print('import: ' + '%.2f' % ratio + 'x baseline')
+        if len(regressions) > 0:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
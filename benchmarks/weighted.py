@@ -0,0 +1,43 @@
+"""
+Benchmark of weight-balanced partitioning using :obj:`parts.parts.parts` with
+the ``weights`` parameter (for both the contiguous and the greedy strategies)
+on inputs having millions of weights.
+
+.. code-block:: bash
+
+    python benchmarks/weighted.py --size 4000000 --number 64
+"""
+import argparse
+import random
+import time
+
+from parts import parts
+
+def main():
+    """
+    Partition skewed weights using each strategy and report the elapsed time
+    and the largest sum of weights in any part (relative to the ideal sum).
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=10 ** 6)
+    parser.add_argument('--number', type=int, default=64)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    weights = [int(rng.paretovariate(1.2) * 1000) for _ in range(args.size)]
+    items = list(range(args.size))
+    ideal = sum(weights) / args.number
+
+    for (label, options) in (
+            ('count', {}),
+            ('contiguous', {'weights': weights}),
+            ('greedy', {'weights': weights, 'strategy': 'greedy'})
+        ):
+        start = time.perf_counter()
+        ps = list(parts(items, args.number, **options))
+        elapsed = time.perf_counter() - start
+        largest = max(sum(weights[i] for i in part) for part in ps)
+        print(label + ': ' + '%.3f' % elapsed + 's (largest/ideal: %.3f)' % (largest / ideal))
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,36 @@
-"""Allow users to access the function directly."""
-from parts.parts import parts
+"""Allow users to access the functions and classes directly."""
+import importlib
+
+from parts.parts import \
+    parts, Parts, PartsIterator, SequenceView, PartitionPlan, part_bounds, parts_stacked, \
+    parts_columns, windows
+from parts.files import file_parts, FilePart, stream_parts
+from parts.buckets import partition_by, Bucket
+from parts.statistics import Statistics
+
+# Members of submodules that depend on modules that are expensive to import
+# (such as :obj:`concurrent.futures` and :obj:`asyncio`) are imported only when
+# first accessed.
+_LAZY = {
+    'parts_map': 'parts.parallel',
+    'PartDispenser': 'parts.parallel',
+    'aparts': 'parts.asynchronous'
+}
+
+def __getattr__(name: str):
+    """
+    Import the submodule that defines a member (if that member is imported
+    on demand) and return that member.
+    """
+    if name not in _LAZY:
+        raise AttributeError("module 'parts' has no attribute '" + name + "'")
+
+    member = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = member
+    return member
+
+def __dir__():
+    """
+    List the members of this module, including those imported on demand.
+    """
+    return sorted(set(globals()) | set(_LAZY))
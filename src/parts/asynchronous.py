@@ -0,0 +1,150 @@
+"""
+Functions for partitioning asynchronous iterable collections.
+"""
+from __future__ import annotations
+from typing import Union, Iterable, AsyncIterable, AsyncIterator
+import collections.abc
+
+from parts.parts import _lengths
+
+async def aparts(
+        aiterable: AsyncIterable,
+        length: Union[int, Iterable[int]],
+        *,
+        max_wait: Union[int, float, None] = None
+    ) -> AsyncIterator[list]:
+    """
+    Split an :obj:`~collections.abc.AsyncIterable` object into a number of
+    parts (as :obj:`list` instances) each of the specified length, in the same
+    way that :obj:`~parts.parts.parts` splits an iterable when only a length
+    parameter is supplied.
+
+    :param aiterable: Asynchronous iterable to split into parts.
+    :param length: Length of every part or iterable of part lengths.
+    :param max_wait: Maximum number of seconds to wait (after the first item of
+        a part is retrieved) before yielding a part that has fewer items than
+        its specified length.
+
+    >>> import asyncio
+    >>> async def numbers(count):
+    ...     for i in range(count):
+    ...         await asyncio.sleep(0)
+    ...         yield i
+    >>> async def collect(aiterable):
+    ...     return [part async for part in aiterable]
+    >>> asyncio.run(collect(aparts(numbers(7), 3)))
+    [[0, 1, 2], [3, 4, 5], [6]]
+    >>> asyncio.run(collect(aparts(numbers(7), 10)))
+    [[0, 1, 2, 3, 4, 5, 6]]
+    >>> asyncio.run(collect(aparts(numbers(0), 3)))
+    []
+    >>> asyncio.run(collect(aparts(numbers(6), [1, 2, 3])))
+    [[0], [1, 2], [3, 4, 5]]
+    >>> asyncio.run(collect(aparts(numbers(6), [2, 10])))
+    [[0, 1], [2, 3, 4, 5]]
+
+    When a maximum waiting time is specified, a part is yielded once that much
+    time has elapsed since its first item was retrieved (even if it has fewer
+    items than its specified length). Any item that has not yet arrived is
+    included in the next part.
+
+    >>> async def bursts():
+    ...     for i in range(6):
+    ...         if i % 2 == 0:
+    ...             await asyncio.sleep(0.1)
+    ...         yield i
+    >>> asyncio.run(collect(aparts(bursts(), 4, max_wait=0.02)))
+    [[0, 1], [2, 3], [4, 5]]
+    >>> asyncio.run(collect(aparts(bursts(), [3, 3, 3], max_wait=0.02)))
+    [[0, 1], [2, 3], [4, 5]]
+    >>> asyncio.run(collect(aparts(bursts(), 4)))
+    [[0, 1, 2, 3], [4, 5]]
+
+    A descriptive exception is raised when parameter values cannot be satisfied
+    or have an incorrect type.
+
+    >>> asyncio.run(collect(aparts(numbers(3), [1, 1, 1, 1])))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    >>> asyncio.run(collect(aparts(numbers(3), 1.5)))
+    Traceback (most recent call last):
+      ...
+    TypeError: length parameter must be an integer or iterable of integers
+    >>> asyncio.run(collect(aparts(numbers(3), [1.5])))
+    Traceback (most recent call last):
+      ...
+    TypeError: length parameter must be an integer or iterable of integers
+    >>> asyncio.run(collect(aparts(numbers(3), 2, max_wait='1')))
+    Traceback (most recent call last):
+      ...
+    TypeError: max_wait parameter must be a number
+    >>> asyncio.run(collect(aparts([1, 2, 3], 2)))
+    Traceback (most recent call last):
+      ...
+    TypeError: object must be an asynchronous iterable
+    """
+    # The ``aiter`` and ``anext`` built-in functions are not available in all
+    # supported versions of Python.
+    # pylint: disable=too-many-branches,unnecessary-dunder-call,import-outside-toplevel
+    import asyncio
+    lengths = _lengths(length)
+    if max_wait is not None and not isinstance(max_wait, (int, float)):
+        raise TypeError('max_wait parameter must be a number')
+
+    if not isinstance(aiterable, collections.abc.AsyncIterable):
+        raise TypeError('object must be an asynchronous iterable')
+
+    iterator = aiterable.__aiter__()
+    loop = asyncio.get_running_loop()
+    exhausted = False
+
+    # When waiting is bounded, retrieval of the next item is a task that may
+    # remain pending across parts (so that no item is lost when a part is
+    # yielded before that item arrives).
+    retrieval = None
+
+    try:
+        for length_ in lengths:
+            (part, deadline) = ([], None)
+            while not exhausted and len(part) < length_:
+                if max_wait is None:
+                    try:
+                        part.append(await iterator.__anext__())
+                    except StopAsyncIteration:
+                        exhausted = True
+                    continue
+
+                if retrieval is None:
+                    retrieval = asyncio.ensure_future(iterator.__anext__())
+                timeout = None if len(part) == 0 else max(0, deadline - loop.time())
+                (done, _) = await asyncio.wait({retrieval}, timeout=timeout)
+                if not done:
+                    break # Yield the items that have arrived before the deadline.
+
+                (finished, retrieval) = (retrieval, None)
+                try:
+                    part.append(finished.result())
+                except StopAsyncIteration:
+                    exhausted = True
+                    continue
+
+                if len(part) == 1:
+                    deadline = loop.time() + max_wait
+
+            if len(part) == 0:
+                if isinstance(length, int):
+                    break
+                raise ValueError(
+                    'object has too few items to retrieve parts having ' + \
+                    'specified part lengths'
+                )
+
+            yield part
+    finally:
+        if retrieval is not None:
+            retrieval.cancel()
+
+if __name__ == '__main__': # pragma: no cover
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,223 @@
+"""
+Functions for partitioning iterable collections by the keys of their items.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Optional, Iterable, Iterator, List
+import os
+import collections.abc
+import tempfile
+import pickle
+import weakref
+import zlib
+import numbers
+from fractions import Fraction
+
+def _hash(value: Any) -> int:
+    """
+    Compute a hash of a key that (unlike the built-in :obj:`hash` function)
+    does not vary between processes or between invocations of the interpreter.
+    Keys that are equal have equal hashes, including numbers of different
+    types (such as ``1``, ``1.0``, and ``True``) and tuples or sets that have
+    equal items.
+
+    >>> (_hash(b'abc'), _hash('abc'), _hash(123), _hash((1, 'a')))
+    (891568578, 891568578, 2286445522, 2275430813)
+    >>> from decimal import Decimal
+    >>> len({_hash(1), _hash(1.0), _hash(True), _hash(Fraction(1)), _hash(Decimal(1))})
+    1
+    >>> (_hash(0.5) == _hash(Fraction(1, 2)), _hash(2 + 0j) == _hash(2))
+    (True, True)
+    >>> _hash(frozenset(['a', 'b', 'c'])) == _hash({'c', 'b', 'a'})
+    True
+    >>> _hash(object())
+    Traceback (most recent call last):
+      ...
+    TypeError: key must be a string, bytes-like object, number, None, tuple, or set
+    """
+    if isinstance(value, complex) and value.imag == 0:
+        value = value.real # Equal to a real number.
+
+    data = None
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        data = value
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+    elif value is None:
+        data = b'None'
+    elif isinstance(value, complex):
+        data = ('complex(' + str(_hash(value.real)) + ',' + str(_hash(value.imag)) + ')').encode()
+    elif isinstance(value, numbers.Number):
+        # Equal numbers of different types have the same exact representation
+        # as a fraction (which is written as an integer if it is integral).
+        try:
+            data = str(Fraction(value)).encode()
+        except (ValueError, OverflowError): # Infinite or not a number.
+            data = repr(float(value)).encode()
+        except TypeError: # Unsupported types of numbers are rejected below.
+            pass
+    elif isinstance(value, tuple):
+        data = ('(' + ','.join(str(_hash(item)) for item in value) + ')').encode()
+    elif isinstance(value, (set, frozenset)):
+        hashes = sorted(_hash(item) for item in value) # Independent of iteration order.
+        data = ('{' + ','.join(map(str, hashes)) + '}').encode()
+
+    if data is None:
+        raise TypeError('key must be a string, bytes-like object, number, None, tuple, or set')
+
+    return zlib.crc32(data)
+
+class Bucket(collections.abc.Iterable):
+    """
+    Bucket of items produced by :obj:`partition_by`. A bucket can be iterated
+    any number of times. Items that were moved to a temporary file (so that
+    they would not be retained in memory) are read from that file during
+    iteration. The temporary file is removed once the bucket is no longer
+    referenced.
+    """
+    def __init__(self, directory: Optional[str] = None):
+        self._items = []
+        self._length = 0
+        self._directory = directory
+        self._path = None
+
+    def _append(self, item: Any):
+        self._items.append(item)
+        self._length += 1
+
+    def _spill(self):
+        """
+        Move the items retained in memory to the temporary file of this bucket.
+        """
+        if self._path is None:
+            (descriptor, self._path) = tempfile.mkstemp(dir=self._directory)
+            os.close(descriptor)
+            weakref.finalize(self, os.remove, self._path)
+
+        # The file is open only while items are written to it, so the number of
+        # open files does not grow with the number of buckets.
+        with open(self._path, 'ab') as file:
+            pickle.dump(self._items, file, pickle.HIGHEST_PROTOCOL)
+        self._items = []
+
+    @property
+    def spilled(self) -> bool:
+        """
+        Whether any items in this bucket are stored in a temporary file.
+        """
+        return self._path is not None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator:
+        if self._path is not None:
+            with open(self._path, 'rb') as file:
+                while True:
+                    try:
+                        items = pickle.load(file)
+                    except EOFError:
+                        break
+                    yield from items
+        yield from self._items
+
+def partition_by(
+        iterable: Iterable,
+        key: Callable,
+        number: int,
+        *,
+        limit: int = 2 ** 20,
+        directory: Optional[str] = None
+    ) -> List[Bucket]:
+    """
+    Split an :obj:`~collections.abc.Iterable` object into the specified number
+    of buckets such that all items having equal keys (as determined by the
+    supplied function) are in the same bucket. The bucket of each item is
+    determined by a hash of its key that does not vary between processes, so
+    the buckets are consistent across runs and machines. The order of the items
+    within each bucket matches their order in the original iterable.
+
+    :param iterable: Iterable to split into buckets.
+    :param key: Function that returns the key of an item (which must be a
+        string, a bytes-like object, a number, ``None``, or a tuple or set of
+        such keys).
+    :param number: Number of buckets.
+    :param limit: Maximum number of items to retain in memory across all
+        buckets.
+    :param directory: Directory in which to create temporary files.
+
+    >>> words = ['apple', 'bee', 'cat', 'dog', 'emu', 'ant', 'bat', 'cow']
+    >>> buckets = partition_by(words, lambda w: w[0], 4)
+    >>> [list(bucket) for bucket in buckets]
+    [['dog'], ['bee', 'bat'], ['emu'], ['apple', 'cat', 'ant', 'cow']]
+    >>> [len(bucket) for bucket in buckets]
+    [1, 2, 1, 4]
+
+    Keys that are equal are always assigned to the same bucket, even if they
+    are of different types.
+
+    >>> from decimal import Decimal
+    >>> buckets = partition_by([1, 1.0, True, Decimal(1), (1, 'a'), (1.0, 'a')], lambda x: x, 16)
+    >>> [list(bucket) for bucket in buckets if len(bucket) > 0]
+    [[1, 1.0, True, Decimal('1')], [(1, 'a'), (1.0, 'a')]]
+
+    Whenever more than the specified number of items would be retained in
+    memory, the items in the largest bucket are moved to a temporary file (by
+    pickling them). Buckets can be iterated any number of times.
+
+    >>> buckets = partition_by(range(1000), lambda i: i % 7, 2, limit=100)
+    >>> [bucket.spilled for bucket in buckets]
+    [True, True]
+    >>> [len(bucket) for bucket in buckets]
+    [428, 572]
+    >>> all(list(bucket) == list(bucket) for bucket in buckets)
+    True
+    >>> sorted(set(i % 7 for i in buckets[0]))
+    [4, 5, 6]
+    >>> sorted(i for bucket in buckets for i in bucket) == list(range(1000))
+    True
+
+    A descriptive exception is raised when parameter values are invalid.
+
+    >>> partition_by([1, 2, 3], lambda x: x, 1.5)
+    Traceback (most recent call last):
+      ...
+    TypeError: number parameter must be an integer
+    >>> partition_by([1, 2, 3], None, 2)
+    Traceback (most recent call last):
+      ...
+    TypeError: key parameter must be callable
+    >>> partition_by([1, 2, 3], lambda x: x, 2, limit=0)
+    Traceback (most recent call last):
+      ...
+    ValueError: limit parameter must be a positive integer
+    >>> partition_by([1, 2, 3], lambda x: [x], 2)
+    Traceback (most recent call last):
+      ...
+    TypeError: key must be a string, bytes-like object, number, None, tuple, or set
+    """
+    # pylint: disable=protected-access
+    if not isinstance(number, int):
+        raise TypeError('number parameter must be an integer')
+
+    if not callable(key):
+        raise TypeError('key parameter must be callable')
+
+    if not isinstance(limit, int) or limit < 1:
+        raise ValueError('limit parameter must be a positive integer')
+
+    number = max(1, number)
+    buckets = [Bucket(directory) for _ in range(number)]
+    retained = 0
+    for item in iterable:
+        buckets[_hash(key(item)) % number]._append(item)
+        retained += 1
+        if retained > limit:
+            largest = max(buckets, key=lambda bucket: len(bucket._items))
+            retained -= len(largest._items)
+            largest._spill()
+
+    return buckets
+
+if __name__ == '__main__': # pragma: no cover
+    import doctest
+    doctest.testmod()
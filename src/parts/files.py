@@ -0,0 +1,312 @@
+"""
+Functions for partitioning the contents of files and binary streams.
+"""
+from __future__ import annotations
+from typing import Any, Union, Optional, Iterable, Iterator, NamedTuple
+import os
+import mmap
+import collections
+
+from parts.parts import PartitionPlan, _lengths
+
+class FilePart(NamedTuple):
+    """
+    Picklable description of a range of bytes within a file, which can be sent
+    to other processes (that can then read the bytes in that range).
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     path = os.path.join(directory, 'data.txt')
+    ...     with open(path, 'wb') as file:
+    ...         _ = file.write(b'abcdefg')
+    ...     FilePart(path, 2, 5).read()
+    b'cde'
+    """
+    path: str
+    start: int
+    stop: int
+
+    def read(self) -> bytes:
+        """
+        Read the bytes in the range described by this instance.
+        """
+        with open(self.path, 'rb') as file:
+            file.seek(self.start)
+            return file.read(self.stop - self.start)
+
+def _snap(contents: mmap.mmap, offsets: Iterable[int], delimiter: bytes) -> Iterator[int]:
+    """
+    Move each offset forward (if necessary) so that it is immediately after an
+    occurrence of the delimiter (or at the end of the contents), skipping any
+    offsets that would not be greater than the preceding offset.
+    """
+    (size, previous) = (len(contents), 0)
+    for offset in offsets:
+        if 0 < offset < size:
+            index = contents.find(delimiter, max(previous, offset - len(delimiter)))
+            offset = size if index == -1 else index + len(delimiter)
+        if offset > previous:
+            yield offset
+            previous = offset
+
+def file_parts(
+        path: Union[str, os.PathLike],
+        number: Optional[int] = None,
+        length: Union[int, Iterable[int], None] = None,
+        *,
+        delimiter: Optional[bytes] = None,
+        descriptors: bool = False
+    ) -> Iterator[Union[memoryview, FilePart]]:
+    """
+    Split the contents of a file into parts in the same way that
+    :obj:`~parts.parts.parts` would split a :obj:`bytes` instance having those
+    contents, without reading the entire file into memory. The file is mapped
+    into memory and each part is a read-only :obj:`memoryview` of a range of
+    the mapped file (so no bytes are copied).
+
+    :param path: Path of the file to split into parts.
+    :param number: Number of parts.
+    :param length: Length of every part or iterable of part lengths.
+    :param delimiter: Delimiter that must appear at the end of every part
+        (except possibly the last part).
+    :param descriptors: Whether to yield :obj:`FilePart` instances (that can
+        be sent to other processes) rather than :obj:`memoryview` instances.
+
+    >>> import tempfile
+    >>> directory = tempfile.TemporaryDirectory()
+    >>> path = os.path.join(directory.name, 'data.csv')
+    >>> with open(path, 'wb') as file:
+    ...     _ = file.write(b'a,1\\nbb,22\\nccc,333\\nd,4\\n')
+    >>> [bytes(part) for part in file_parts(path, 3)]
+    [b'a,1\\nbb,', b'22\\nccc,', b'333\\nd,4\\n']
+    >>> [bytes(part) for part in file_parts(path, length=8)]
+    [b'a,1\\nbb,2', b'2\\nccc,33', b'3\\nd,4\\n']
+
+    When a delimiter is specified, the boundary between each pair of adjacent
+    parts is moved forward (if necessary) to the position immediately after the
+    next occurrence of the delimiter, so that no record is split across two
+    parts. Parts that would become empty are skipped, so there may be fewer
+    parts than requested.
+
+    >>> [bytes(part) for part in file_parts(path, 3, delimiter=b'\\n')]
+    [b'a,1\\nbb,22\\n', b'ccc,333\\n', b'd,4\\n']
+    >>> [bytes(part) for part in file_parts(path, 10, delimiter=b'\\n')]
+    [b'a,1\\n', b'bb,22\\n', b'ccc,333\\n', b'd,4\\n']
+    >>> [bytes(part) for part in file_parts(path, length=[2, 20], delimiter=b',3')]
+    [b'a,1\\nbb,22\\nccc,3', b'33\\nd,4\\n']
+
+    Descriptors of the parts can be sent to other processes, which can read
+    the bytes in each part from the file.
+
+    >>> list(file_parts(path, 2, delimiter=b'\\n', descriptors=True)) == [
+    ...     FilePart(path, 0, 18), FilePart(path, 18, 22)
+    ... ]
+    True
+    >>> [part.read() for part in file_parts(path, 2, delimiter=b'\\n', descriptors=True)]
+    [b'a,1\\nbb,22\\nccc,333\\n', b'd,4\\n']
+
+    Parameters are validated in the same way (and raise the same exceptions) as
+    they are by :obj:`~parts.parts.parts`.
+
+    >>> list(file_parts(path, 2, length=2))
+    Traceback (most recent call last):
+      ...
+    ValueError: cannot retrieve 2 parts from object given part length parameter of 2
+    >>> list(file_parts(path, 2, delimiter='\\n'))
+    Traceback (most recent call last):
+      ...
+    TypeError: delimiter parameter must be a non-empty bytes-like object
+    >>> empty = os.path.join(directory.name, 'empty.csv')
+    >>> open(empty, 'wb').close()
+    >>> list(file_parts(empty, 3))
+    []
+    >>> directory.cleanup()
+    """
+    # pylint: disable=too-many-arguments
+    if delimiter is not None:
+        if not isinstance(delimiter, (bytes, bytearray)) or len(delimiter) == 0:
+            raise TypeError('delimiter parameter must be a non-empty bytes-like object')
+
+    path = os.fspath(path)
+    size = os.path.getsize(path)
+    offsets = PartitionPlan.cached(size, number, length).offsets
+    if size == 0:
+        return
+
+    with open(path, 'rb') as file:
+        contents = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        if delimiter is not None:
+            offsets = list(_snap(contents, offsets[1:], delimiter))
+            offsets.insert(0, 0)
+
+        whole = None if descriptors else memoryview(contents)
+        for (start, stop) in zip(offsets, offsets[1:]):
+            yield FilePart(path, start, stop) if descriptors else whole[start:stop]
+    finally:
+        whole = None
+        try:
+            contents.close()
+        except BufferError:
+            pass # Parts that are still in use keep the mapping open.
+
+def _reclaim(buffer: bytearray, size: int) -> bool:
+    """
+    Determine whether a buffer has no remaining exports (so that it can be
+    reused) and, if so, ensure that it has at least the specified size.
+    """
+    try:
+        buffer.append(0) # Resizing fails if any views of the buffer remain.
+    except BufferError:
+        return False
+    del buffer[-1]
+    if len(buffer) < size:
+        buffer.extend(bytes(size - len(buffer)))
+    return True
+
+def _fill(stream: Any, view: memoryview) -> int:
+    """
+    Read bytes from a stream into a view until the view is full or the stream
+    is exhausted, returning the number of bytes read.
+
+    >>> import io
+    >>> class NonBlocking(io.RawIOBase):
+    ...     def readinto(self, buffer):
+    ...         return None
+    >>> _fill(NonBlocking(), memoryview(bytearray(4)))
+    Traceback (most recent call last):
+      ...
+    BlockingIOError: stream must be in blocking mode
+    """
+    filled = 0
+    while filled < len(view):
+        with view[filled:] as remaining:
+            count = stream.readinto(remaining)
+        if count is None: # No bytes are available from a non-blocking stream.
+            raise BlockingIOError('stream must be in blocking mode')
+        if count == 0:
+            break
+        filled += count
+    return filled
+
+def stream_parts(
+        stream: Any,
+        length: Union[int, Iterable[int]],
+        *,
+        buffers: int = 2
+    ) -> Iterator[memoryview]:
+    """
+    Split the contents of a binary stream (such as an instance of
+    :obj:`io.RawIOBase` or :obj:`io.BufferedReader` for a pipe or socket) into
+    parts in the same way that :obj:`~parts.parts.parts` would split a
+    :obj:`bytes` instance having those contents when only a length parameter is
+    supplied. The stream does not need to be seekable, but it must be in
+    blocking mode (an exception is raised if no bytes are available from a
+    non-blocking stream).
+
+    :param stream: Binary stream (supporting ``readinto``) to split into parts.
+    :param length: Length of every part or iterable of part lengths.
+    :param buffers: Number of buffers to keep for reuse.
+
+    >>> import io
+    >>> [bytes(part) for part in stream_parts(io.BytesIO(b'abcdefg'), 3)]
+    [b'abc', b'def', b'g']
+    >>> [bytes(part) for part in stream_parts(io.BytesIO(b'abcdefg'), [1, 2, 10])]
+    [b'a', b'bc', b'defg']
+    >>> list(stream_parts(io.BytesIO(b''), 3))
+    []
+
+    Each part is a :obj:`memoryview` of a :obj:`bytearray` buffer into which
+    bytes are read directly from the stream. A buffer is reused for a later
+    part once the view of it has been released (*e.g.*, by invoking
+    :obj:`~memoryview.release` or using the view as a context manager) and
+    all other views of it have been discarded. A new buffer is allocated only
+    when none of the kept buffers is available, so no bytes are copied and
+    (beyond the kept buffers) no memory is allocated when each part is
+    released before the next part is retrieved.
+
+    >>> chunks = stream_parts(io.BytesIO(bytes(range(10))), 4, buffers=1)
+    >>> with next(chunks) as part:
+    ...     (buffer, items) = (part.obj, part.tolist())
+    >>> items
+    [0, 1, 2, 3]
+    >>> with next(chunks) as part:
+    ...     (part.obj is buffer, part.tolist())
+    (True, [4, 5, 6, 7])
+    >>> kept = next(chunks)
+    >>> (kept.obj is buffer, kept.tolist())
+    (True, [8, 9])
+
+    A part that is not released remains valid, as its buffer is not reused.
+
+    >>> chunks = stream_parts(io.BytesIO(b'abcdefg'), 2, buffers=1)
+    >>> (first, second) = (next(chunks), next(chunks))
+    >>> (bytes(first), bytes(second), first.obj is second.obj)
+    (b'ab', b'cd', False)
+
+    Parameters are validated in the same way (and raise the same exceptions) as
+    they are by :obj:`~parts.parts.parts`.
+
+    >>> list(stream_parts(io.BytesIO(b'abc'), [1, 1, 1, 1]))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    >>> list(stream_parts(io.BytesIO(b'abcdefgh'), [4, -1, 2], buffers=1))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    >>> list(stream_parts(io.BytesIO(b'abc'), 1.5))
+    Traceback (most recent call last):
+      ...
+    TypeError: length parameter must be an integer or iterable of integers
+    >>> list(stream_parts(io.StringIO('abc'), 2))
+    Traceback (most recent call last):
+      ...
+    TypeError: object must be a binary stream that supports readinto
+    >>> list(stream_parts(io.BytesIO(b'abc'), 2, buffers=0))
+    Traceback (most recent call last):
+      ...
+    ValueError: buffers parameter must be a positive integer
+    """
+    # A part length that is not positive yields an empty part (and, as in the
+    # case of parts(), an exception).
+    lengths = (max(0, length_) for length_ in _lengths(length))
+    if not isinstance(buffers, int) or buffers < 1:
+        raise ValueError('buffers parameter must be a positive integer')
+
+    if not hasattr(stream, 'readinto'):
+        raise TypeError('object must be a binary stream that supports readinto')
+
+    size = max(1, length) if isinstance(length, int) else 0
+    pool = collections.deque(bytearray(size) for _ in range(buffers))
+    for length_ in lengths:
+        # Use the least recently used buffer that is no longer referenced by
+        # any view, or replace it with a new buffer if there is no such buffer.
+        for _ in range(len(pool)):
+            if _reclaim(pool[0], length_):
+                break
+            pool.rotate(-1)
+        else:
+            pool[0] = bytearray(length_)
+        buffer = pool[0]
+        pool.rotate(-1)
+
+        with memoryview(buffer) as view:
+            part = view[:_fill(stream, view[:length_])]
+
+        if len(part) == 0:
+            part.release()
+            if not isinstance(length, int):
+                raise ValueError(
+                    'object has too few items to retrieve parts having ' + \
+                    'specified part lengths'
+                )
+            break
+
+        yield part
+        del part # Only the consumer may retain a view of the buffer.
+
+if __name__ == '__main__': # pragma: no cover
+    import doctest
+    doctest.testmod()
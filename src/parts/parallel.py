@@ -0,0 +1,402 @@
+"""
+Functions for processing the parts of iterable collections in parallel.
+"""
+from __future__ import annotations
+from typing import \
+    TYPE_CHECKING, Any, Callable, Union, Optional, Iterable, Iterator, Tuple, List
+import sys
+import os
+import functools
+import itertools
+import threading
+import collections
+import collections.abc
+
+from parts.parts import parts, PartitionPlan, _numpy, _sliceable, _lengths
+
+if TYPE_CHECKING: # pragma: no cover
+    import concurrent.futures
+    from multiprocessing import shared_memory
+
+@functools.lru_cache(maxsize=None)
+def _untracked(pid: int) -> bool: # pylint: disable=unused-argument
+    """
+    Determine whether the current process (having the supplied identifier) had
+    no resource tracker when it first attached to a shared memory block. The
+    identifier ensures that forked processes do not inherit the result.
+    """
+    from multiprocessing import resource_tracker # pylint: disable=import-outside-toplevel
+    return resource_tracker._resource_tracker._fd is None # pylint: disable=protected-access
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to an existing shared memory block without making the resource
+    tracker of the current process responsible for the block.
+    """
+    # pylint: disable=import-outside-toplevel
+    from multiprocessing import shared_memory, resource_tracker
+    if sys.version_info >= (3, 13): # pragma: no cover
+        return shared_memory.SharedMemory( # pylint: disable=unexpected-keyword-arg
+            name=name,
+            track=False
+        )
+
+    # Prior to Python 3.13, attaching to a block always registers it with the
+    # resource tracker. A worker process that was forked before the tracker of
+    # the parent process was started has no tracker, so a new tracker would be
+    # started that unlinks the block (and emits warnings) when the worker exits.
+    untracked = _untracked(os.getpid())
+    block = shared_memory.SharedMemory(name=name)
+    if untracked:
+        resource_tracker.unregister(block._name, 'shared_memory') # pylint: disable=protected-access
+    return block
+
+def _shared_part(descriptor: Tuple, lower: int, upper: int) -> Tuple[Any, Any]:
+    """
+    Attach to the shared memory block described by a descriptor (as created
+    by :obj:`_share`) and retrieve a part of the object that it contains. The
+    shared memory block is returned along with the part so that the caller can
+    close it once the part is no longer needed.
+    """
+    (name, kind, shape, dtype) = descriptor
+    block = _attach(name)
+    if kind == 'ndarray':
+        numpy = _numpy()
+        dtype = numpy.dtype(dtype)
+        row = dtype.itemsize * int(numpy.prod(shape[1:], dtype=numpy.int64))
+        part = numpy.ndarray(
+            (upper - lower,) + tuple(shape[1:]),
+            dtype=dtype,
+            buffer=block.buf,
+            offset=lower * row
+        )
+    else:
+        part = (bytes if kind == 'bytes' else bytearray)(block.buf[lower:upper])
+    return (block, part)
+
+def _call_shared(function: Callable, descriptor: Tuple, lower: int, upper: int) -> Any:
+    """
+    Apply a function to a part of an object in a shared memory block. This
+    function is invoked within worker processes.
+    """
+    (block, part) = _shared_part(descriptor, lower, upper)
+    try:
+        return function(part)
+    finally:
+        del part
+        try:
+            block.close()
+        except BufferError: # pragma: no cover
+            pass # The result refers to the block, which remains open until released.
+
+def _share(iterable: Any) -> Optional[Tuple[shared_memory.SharedMemory, Tuple]]:
+    """
+    Copy a :obj:`bytes` instance, a :obj:`bytearray` instance, or a NumPy array
+    into a new shared memory block. The block is returned along with a
+    picklable descriptor that worker processes can use to reconstruct the
+    object. If the object is of any other type (or shared memory blocks are
+    not supported), ``None`` is returned.
+    """
+    if isinstance(iterable, (bytes, bytearray)):
+        kind = 'bytes' if isinstance(iterable, bytes) else 'bytearray'
+        (size, shape, dtype) = (len(iterable), None, None)
+    elif 'numpy' in sys.modules and \
+         isinstance(iterable, sys.modules['numpy'].ndarray) and \
+         not iterable.dtype.hasobject and iterable.ndim > 0:
+        (kind, size) = ('ndarray', iterable.nbytes)
+        (shape, dtype) = (tuple(iterable.shape), iterable.dtype.str)
+    else:
+        return None
+
+    try:
+        from multiprocessing import shared_memory # pylint: disable=import-outside-toplevel
+    except ImportError: # pragma: no cover
+        return None # Shared memory blocks are only available in Python 3.8 or later.
+
+    block = shared_memory.SharedMemory(create=True, size=max(1, size))
+    if kind == 'ndarray':
+        numpy = _numpy()
+        numpy.ndarray(shape, dtype=dtype, buffer=block.buf)[...] = iterable
+    else:
+        block.buf[:size] = iterable
+
+    return (block, (block.name, kind, shape, dtype))
+
+def parts_map(
+        function: Callable,
+        iterable: Iterable,
+        number: Optional[int] = None,
+        length: Union[int, Iterable[int], None] = None,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        pending: Optional[int] = None
+    ) -> Iterator:
+    """
+    Apply a function to each of the parts of an :obj:`~collections.abc.Iterable`
+    object (as determined by :obj:`~parts.parts.parts` for the same arguments)
+    using an executor, yielding the results in the order of the parts.
+
+    :param function: Function to apply to each part.
+    :param iterable: Iterable to split into parts.
+    :param number: Number of parts.
+    :param length: Length of every part or iterable of part lengths.
+    :param executor: Executor to which to submit the parts (a
+        :obj:`~concurrent.futures.ThreadPoolExecutor` is created and used for
+        the duration of the call if none is supplied).
+    :param pending: Maximum number of parts that have been submitted to the
+        executor but whose results have not been yielded (twice the number of
+        available CPUs by default).
+
+    Parts of iterators are retrieved (as :obj:`list` instances) before they are
+    submitted, as they all depend on the same underlying iterator.
+
+    >>> import concurrent.futures
+    >>> list(parts_map(sum, [1, 2, 3, 4, 5, 6, 7], 3))
+    [3, 7, 18]
+    >>> list(parts_map(len, iter(range(10)), length=[1, 2, 3, 4]))
+    [1, 2, 3, 4]
+    >>> with concurrent.futures.ThreadPoolExecutor(2) as executor:
+    ...     list(parts_map(max, range(100), length=10, executor=executor, pending=2))
+    [9, 19, 29, 39, 49, 59, 69, 79, 89, 99]
+
+    Parts of :obj:`bytes` instances, :obj:`bytearray` instances, and NumPy
+    arrays are not pickled when they are submitted to a
+    :obj:`~concurrent.futures.ProcessPoolExecutor`. Instead, the object is
+    copied once into a :obj:`~multiprocessing.shared_memory.SharedMemory`
+    block and each worker receives only the name of the block and the
+    boundaries of its part. Workers receive parts of :obj:`bytes` and
+    :obj:`bytearray` instances as instances of the same type, while the parts
+    of NumPy arrays are views of the shared memory block (that are only valid
+    during the invocation of the function).
+
+    >>> with concurrent.futures.ProcessPoolExecutor(2) as executor:
+    ...     list(parts_map(sum, bytes(range(10)), 3, executor=executor))
+    [3, 12, 30]
+    >>> with concurrent.futures.ProcessPoolExecutor(2) as executor:
+    ...     list(parts_map(bytearray.upper, bytearray(b'abcdefg'), length=3, executor=executor))
+    [bytearray(b'ABC'), bytearray(b'DEF'), bytearray(b'G')]
+    >>> import numpy
+    >>> a = numpy.arange(20).reshape((10, 2))
+    >>> with concurrent.futures.ProcessPoolExecutor(2) as executor:
+    ...     [r.tolist() for r in parts_map(numpy.sum, a, length=[3, 7], executor=executor)]
+    [15, 175]
+
+    Exceptions raised by the function are raised when the corresponding result
+    would have been yielded.
+
+    >>> with concurrent.futures.ProcessPoolExecutor(2) as executor:
+    ...     list(parts_map(int, b'abc', 2, executor=executor))
+    Traceback (most recent call last):
+      ...
+    ValueError: invalid literal for int() with base 10: b'a'
+    >>> list(parts_map(sum, [1, 2, 3], 1.5))
+    Traceback (most recent call last):
+      ...
+    TypeError: number parameter must be an integer
+    >>> with concurrent.futures.ProcessPoolExecutor(2) as executor:
+    ...     list(parts_map(sum, bytes(100), 2, [10, 10], executor=executor))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too many items to retrieve parts having specified part lengths
+    """
+    # pylint: disable=too-many-arguments,too-many-locals,import-outside-toplevel
+    import concurrent.futures
+    if executor is None:
+        with concurrent.futures.ThreadPoolExecutor() as executor_:
+            yield from parts_map(
+                function, iterable, number, length,
+                executor=executor_, pending=pending
+            )
+        return
+
+    pending = 2 * (os.cpu_count() or 1) if pending is None else max(1, pending)
+    shared = None
+    if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+        shared = _share(iterable)
+
+    block = None if shared is None else shared[0]
+    futures = collections.deque()
+    try:
+        # The parameters are validated within this block so that the shared
+        # memory block is released even if they are invalid.
+        if shared is not None:
+            descriptor = shared[1]
+            submissions = (
+                (_call_shared, function, descriptor, lower, upper)
+                for (lower, upper) in PartitionPlan.cached(len(iterable), number, length)
+            )
+        else:
+            submissions = (
+                (function, part if isinstance(part, collections.abc.Sized) else list(part))
+                for part in parts(iterable, number, length)
+            )
+
+        for submission in submissions:
+            if len(futures) >= pending:
+                yield futures.popleft().result()
+            futures.append(executor.submit(*submission))
+        while len(futures) > 0:
+            yield futures.popleft().result()
+    finally:
+        for future in futures:
+            future.cancel()
+        if block is not None:
+            concurrent.futures.wait(futures)
+            block.close()
+            block.unlink()
+
+def _guided(size: int, number: int, minimum: int) -> List[int]:
+    """
+    Compute the part boundary offsets for the guided schedule, in which each
+    part has a fraction (determined by the number of workers) of the items that
+    remain (but no fewer than the specified minimum number of items).
+
+    >>> _guided(20, 4, 1)
+    [0, 5, 9, 12, 14, 16, 17, 18, 19, 20]
+    >>> _guided(20, 4, 3)
+    [0, 5, 9, 12, 15, 18, 20]
+    """
+    offsets = [0]
+    while offsets[-1] < size:
+        remaining = size - offsets[-1]
+        offsets.append(offsets[-1] + min(remaining, max(minimum, -(-remaining // number))))
+    return offsets
+
+class PartDispenser(collections.abc.Iterator): # pylint: disable=too-few-public-methods
+    """
+    Thread-safe :obj:`~collections.abc.Iterator` that dispenses the parts of an
+    :obj:`~collections.abc.Iterable` object on demand, so that any number of
+    workers can retrieve parts from the same instance until none remain.
+
+    :param iterable: Iterable to split into parts.
+    :param number: Number of parts (or number of workers for the ``'guided'``
+        schedule).
+    :param length: Length of every part or iterable of part lengths (or the
+        minimum part length for the ``'guided'`` schedule).
+    :param schedule: Schedule that determines the part lengths (either
+        ``'static'``, ``'dynamic'``, or ``'guided'``).
+
+    The ``'static'`` schedule dispenses the parts that :obj:`~parts.parts.parts`
+    would yield for the same arguments. The ``'dynamic'`` schedule dispenses
+    parts of a fixed length.
+
+    >>> list(PartDispenser([1, 2, 3, 4, 5, 6, 7], 3))
+    [[1, 2], [3, 4], [5, 6, 7]]
+    >>> list(PartDispenser(range(10), length=4, schedule='dynamic'))
+    [range(0, 4), range(4, 8), range(8, 10)]
+
+    The ``'guided'`` schedule dispenses parts that become shorter as fewer items
+    remain: each part has the specified fraction (such as one over the number
+    of workers) of the remaining items. Early parts are long (so there are few
+    requests for parts) and later parts are short (so workers that finish at
+    different times remain balanced).
+
+    >>> [len(p) for p in PartDispenser(range(100), 4, schedule='guided')]
+    [25, 19, 14, 11, 8, 6, 5, 3, 3, 2, 1, 1, 1, 1]
+    >>> [len(p) for p in PartDispenser(range(100), 4, 5, schedule='guided')]
+    [25, 19, 14, 11, 8, 6, 5, 5, 5, 2]
+
+    Parts of objects that have a length and support slicing are determined in
+    advance, so a worker retrieves a part by incrementing a counter (without
+    acquiring a lock). Parts of iterators are retrieved (as :obj:`list`
+    instances) while holding a lock.
+
+    >>> import concurrent.futures
+    >>> dispenser = PartDispenser(range(10 ** 5), length=1000, schedule='dynamic')
+    >>> with concurrent.futures.ThreadPoolExecutor(4) as executor:
+    ...     futures = [executor.submit(lambda: sum(map(sum, dispenser))) for _ in range(4)]
+    >>> sum(future.result() for future in futures) == sum(range(10 ** 5))
+    True
+    >>> dispenser = PartDispenser(iter(range(10 ** 5)), length=1000, schedule='dynamic')
+    >>> with concurrent.futures.ThreadPoolExecutor(4) as executor:
+    ...     futures = [executor.submit(lambda: sum(map(sum, dispenser))) for _ in range(4)]
+    >>> sum(future.result() for future in futures) == sum(range(10 ** 5))
+    True
+    >>> list(PartDispenser(iter(range(7)), length=[3, 4]))
+    [[0, 1, 2], [3, 4, 5, 6]]
+
+    A descriptive exception is raised when parameter values cannot be satisfied
+    or have an incorrect type.
+
+    >>> PartDispenser([1, 2, 3], 2, schedule='random')
+    Traceback (most recent call last):
+      ...
+    ValueError: schedule parameter must be 'static', 'dynamic', or 'guided'
+    >>> PartDispenser([1, 2, 3], 2, schedule='dynamic')
+    Traceback (most recent call last):
+      ...
+    ValueError: dynamic schedule requires a single part length parameter
+    >>> PartDispenser([1, 2, 3], length=2, schedule='guided')
+    Traceback (most recent call last):
+      ...
+    ValueError: guided schedule requires number of parts parameter
+    >>> PartDispenser(iter([1, 2, 3]), 2)
+    Traceback (most recent call last):
+      ...
+    TypeError: object must have length to determine part lengths from number parameter
+    >>> list(PartDispenser(iter([1, 2, 3]), length=[2, 2, 2]))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    """
+    def __init__(
+            self,
+            iterable: Iterable,
+            number: Optional[int] = None,
+            length: Union[int, Iterable[int], None] = None,
+            *,
+            schedule: str = 'static'
+        ):
+        if schedule not in ('static', 'dynamic', 'guided'):
+            raise ValueError("schedule parameter must be 'static', 'dynamic', or 'guided'")
+
+        if schedule == 'dynamic' and (number is not None or not isinstance(length, int)):
+            raise ValueError('dynamic schedule requires a single part length parameter')
+
+        if schedule == 'guided':
+            if not isinstance(number, int):
+                raise ValueError('guided schedule requires number of parts parameter')
+            if length is not None and not isinstance(length, int):
+                raise TypeError('length parameter must be an integer')
+
+        self._iterable = iterable
+        size = _sliceable(iterable)
+        if size is None:
+            if number is not None:
+                raise TypeError(
+                    'object must have length to determine part lengths from number parameter'
+                )
+            self._offsets = None
+            self._lengths = _lengths(length)
+            self._fixed = isinstance(length, int)
+            self._iterator = iter(iterable)
+            self._lock = threading.Lock()
+        else:
+            self._offsets = _guided(size, max(1, number), max(1, length or 1)) \
+                if schedule == 'guided' else \
+                PartitionPlan.cached(size, number, length).offsets
+            self._counter = itertools.count()
+
+    def __next__(self):
+        if self._offsets is not None:
+            # Retrieval of the next value of the counter is atomic.
+            k = next(self._counter)
+            if k >= len(self._offsets) - 1:
+                raise StopIteration
+            return self._iterable[self._offsets[k]:self._offsets[k + 1]]
+
+        with self._lock:
+            part = list(itertools.islice(self._iterator, next(self._lengths)))
+            if len(part) == 0:
+                self._lengths = iter(())
+                if self._fixed:
+                    raise StopIteration
+                raise ValueError(
+                    'object has too few items to retrieve parts having ' + \
+                    'specified part lengths'
+                )
+            return part
+
+if __name__ == '__main__': # pragma: no cover
+    import doctest
+    doctest.testmod()
@@ -2,14 +2,154 @@
 Minimal library that enables partitioning of iterable collections in a concise
 manner.
 """
-import doctest
-from typing import Tuple, Union, Optional, Iterable
+# pylint: disable=too-many-lines
+from __future__ import annotations
+from typing import \
+    TYPE_CHECKING, Tuple, Union, Optional, Callable, Iterable, Iterator, Sequence, List
+import sys
+import math
 import collections.abc
-from itertools import islice, chain
+import threading
+import queue
+import time
+import heapq
+from bisect import bisect_right
+import itertools
+from itertools import islice, chain, accumulate, repeat
+from array import array
 
-def _empty(iterable: Iterable) -> Tuple[Iterable, bool]:
+if TYPE_CHECKING: # pragma: no cover
+    from parts.statistics import Statistics
+
+class SequenceView(collections.abc.Sequence):
+    """
+    Read-only view of a range of entries within a :obj:`list` or :obj:`tuple`
+    instance. Entries are retrieved from the underlying instance on demand, so
+    no entries are copied when a view is created or sliced (and any changes to
+    the underlying instance are reflected in the view).
+
+    >>> xs = [1, 2, 3, 4, 5]
+    >>> v = SequenceView(xs)[1:4]
+    >>> v
+    SequenceView([2, 3, 4])
+    >>> (len(v), v[0], v[-1], v[1:], list(v[::2]))
+    (3, 2, 4, SequenceView([3, 4]), [2, 4])
+    >>> xs[2] = 30
+    >>> v
+    SequenceView([2, 30, 4])
+    >>> SequenceView((1, 2, 3))[:2]
+    SequenceView((1, 2))
+    >>> v[3]
+    Traceback (most recent call last):
+      ...
+    IndexError: range object index out of range
+    """
+    def __init__(self, sequence: Sequence, indices: Optional[range] = None):
+        self._sequence = sequence
+        self._indices = range(len(sequence)) if indices is None else indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return SequenceView(self._sequence, self._indices[key])
+        return self._sequence[self._indices[key]]
+
+    def __iter__(self) -> Iterator:
+        return map(self._sequence.__getitem__, self._indices)
+
+    def __repr__(self) -> str:
+        entries = tuple(self) if isinstance(self._sequence, tuple) else list(self)
+        return 'SequenceView(' + repr(entries) + ')'
+
+def _view(iterable: Iterable) -> Iterable:
+    """
+    Wrap an object (if possible) so that slices of the wrapped object refer to
+    the entries of the original object rather than copying them.
+
+    >>> isinstance(_view([1, 2, 3]), SequenceView)
+    True
+    >>> isinstance(_view(bytes([1, 2, 3])), memoryview)
+    True
+    >>> _view('abc')
+    'abc'
+    """
+    if isinstance(iterable, (list, tuple)):
+        return SequenceView(iterable)
+
+    # Objects such as NumPy arrays already produce views when sliced (and
+    # their type should be preserved), so only other buffers are wrapped.
+    if not hasattr(iterable, '__array_interface__'):
+        try:
+            return memoryview(iterable)
+        except TypeError:
+            pass
+
+    return iterable
+
+class _AxisView:
+    """
+    Wrapper for an array that makes slices of the wrapped array (and its
+    length) refer to the specified axis of the array. Slices of arrays along
+    any axis are views (so no entries are copied).
+
+    >>> import numpy
+    >>> a = numpy.arange(6).reshape((2, 3))
+    >>> v = _AxisView(a, -1)
+    >>> len(v)
+    3
+    >>> v[1:].tolist()
+    [[1, 2], [4, 5]]
+    >>> _AxisView(a, 2)
+    Traceback (most recent call last):
+      ...
+    ValueError: axis parameter is out of range for object
+    >>> _AxisView(a, 1.0)
+    Traceback (most recent call last):
+      ...
+    TypeError: axis parameter must be an integer
+    >>> _AxisView([1, 2, 3], 0)
+    Traceback (most recent call last):
+      ...
+    TypeError: object must be an array to be split along an axis
+    """
+    def __init__(self, iterable: Sequence, axis: int):
+        if not isinstance(axis, int):
+            raise TypeError('axis parameter must be an integer')
+
+        try:
+            dimensions = iterable.ndim
+        except AttributeError:
+            raise TypeError('object must be an array to be split along an axis') from None
+
+        try:
+            axis = range(dimensions)[axis]
+        except IndexError:
+            raise ValueError('axis parameter is out of range for object') from None
+
+        self.iterable = iterable
+        self.axis = axis
+        self._prefix = (slice(None),) * axis
+
+    def __len__(self) -> int:
+        return self.iterable.shape[self.axis]
+
+    def __getitem__(self, key):
+        return self.iterable[self._prefix + (key,)]
+
+def _prepare(iterable: Iterable, view: bool, axis: Optional[int]) -> Iterable:
+    """
+    Wrap an object (if necessary) according to the view and axis parameters.
+    """
+    if axis is not None:
+        return _AxisView(iterable, axis)
+    return _view(iterable) if view else iterable
+
+def _empty(iterable: Iterable, axis: Optional[int] = None) -> Tuple[Iterable, bool]:
     """
-    Determine whether a sequential type instance is empty.
+    Determine whether a sequential type instance is empty (along the specified
+    axis, if one is specified).
 
     >>> def error():
     ...     for i in range(2):
@@ -23,6 +163,9 @@ def _empty(iterable: Iterable) -> Tuple[Iterable, bool]:
       ...
     RuntimeError: error in generator
     """
+    if axis is not None:
+        return (iterable, iterable.shape[axis] == 0)
+
     try:
         return (iterable, len(iterable) == 0)
     except TypeError:
@@ -34,6 +177,21 @@ def _empty(iterable: Iterable) -> Tuple[Iterable, bool]:
         except Exception as e:
             raise e from None
 
+def _sliceable(iterable: Iterable) -> Optional[int]:
+    """
+    Return the length of an object if it has a length and supports slicing
+    (or ``None`` otherwise).
+
+    >>> (_sliceable([1, 2, 3]), _sliceable({1, 2, 3}), _sliceable(iter([1])))
+    (3, None, None)
+    """
+    try:
+        size = len(iterable)
+        iterable[0:0] # pylint: disable=pointless-statement
+    except (TypeError, KeyError):
+        return None
+    return size
+
 def _slice(iterable: Iterable, lower: int, upper: int) -> Iterable:
     """
     Attempt to retrieve a subsequence of a sequential type instance
@@ -49,10 +207,591 @@ def _slice(iterable: Iterable, lower: int, upper: int) -> Iterable:
                 'object does not support retrieval of slices'
             ) from None
 
+def _batches(
+        iterator: Iterator,
+        length: Union[int, Iterable[int]],
+        materialize: type
+    ) -> Iterator[Union[tuple, list]]:
+    """
+    Retrieve parts of an iterator as materialized :obj:`tuple` or :obj:`list`
+    instances, using :obj:`itertools.batched` when it is available.
+
+    >>> list(_batches(iter(range(5)), 2, tuple))
+    [(0, 1), (2, 3), (4,)]
+    >>> list(_batches(iter(range(5)), 2, list))
+    [[0, 1], [2, 3], [4]]
+    >>> list(_batches(iter(range(5)), [1, 4], list))
+    [[0], [1, 2, 3, 4]]
+    >>> list(_batches(iter(range(5)), [1, -1, 2], list))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    """
+    if isinstance(length, int):
+        length = max(1, length)
+        if materialize is tuple and hasattr(itertools, 'batched'): # pragma: no cover
+            return itertools.batched(iterator, length) # pylint: disable=no-member
+        return iter(lambda: materialize(islice(iterator, length)), materialize())
+
+    def batches():
+        for length_ in _lengths(length):
+            part = materialize(islice(iterator, max(0, length_)))
+            if len(part) == 0: # Also the case if the part length is not positive.
+                raise ValueError(
+                    'object has too few items to retrieve parts having ' + \
+                    'specified part lengths'
+                )
+            yield part
+
+    return batches()
+
+def _lengths(length: Union[int, Iterable[int]]) -> Iterator[int]:
+    """
+    Convert a part length parameter (for retrieval of parts from an object
+    having no length) into an iterator of part lengths, ensuring that each part
+    length is an integer as it is retrieved.
+
+    >>> list(islice(_lengths(0), 3))
+    [1, 1, 1]
+    >>> list(_lengths([1, 2.5]))
+    Traceback (most recent call last):
+      ...
+    TypeError: length parameter must be an integer or iterable of integers
+    """
+    if isinstance(length, int):
+        return repeat(max(1, length))
+
+    if not isinstance(length, collections.abc.Iterable):
+        raise TypeError('length parameter must be an integer or iterable of integers')
+
+    def lengths():
+        for length_ in length:
+            if not isinstance(length_, int):
+                raise TypeError('length parameter must be an integer or iterable of integers')
+            yield length_
+
+    return lengths()
+
+class _Offsets(collections.abc.Sequence):
+    """
+    Sequence of part boundary offsets computed in closed form. The offset at
+    index ``k`` is ``min(k * length + max(0, k - shift), limit)``, which covers
+    both the even distribution used when the number of parts is specified and
+    the fixed-length parts used when a single part length is specified.
+
+    >>> list(_Offsets(3, 2, 2, 7))
+    [0, 2, 4, 7]
+    >>> list(_Offsets(3, 3, 3, 7))
+    [0, 3, 6, 7]
+    >>> _Offsets(3, 3, 3, 7)[-2:]
+    [6, 7]
+    >>> all(
+    ...     list(_Offsets(n, 23 // n, n - 23 % n, 23)) == \\
+    ...     [_Offsets(n, 23 // n, n - 23 % n, 23)[k] for k in range(n + 1)]
+    ...     for n in range(1, 24)
+    ... )
+    True
+    """
+    def __init__(self, count: int, length: int, shift: int, limit: int):
+        self._count = count
+        self._length = length
+        self._shift = shift
+        self._limit = limit
+
+    def __len__(self) -> int:
+        return self._count + 1
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[k] for k in range(self._count + 1)[key]]
+        k = range(self._count + 1)[key]
+        return min(k * self._length + max(0, k - self._shift), self._limit)
+
+    def __iter__(self) -> Iterator[int]:
+        # Offsets increase by ``length`` up to the shift index and by
+        # ``length + 1`` afterwards (with the last offset always at the limit),
+        # so they can be enumerated using ranges rather than arithmetic on
+        # each index.
+        if self._count == 0:
+            return iter((self._limit,))
+        split = min(self._shift, self._count)
+        return chain(
+            range(0, split * self._length, self._length),
+            range(
+                split * self._length,
+                self._count * (self._length + 1) - self._shift,
+                self._length + 1
+            ),
+            (self._limit,)
+        )
+
+    def vectorized(self):
+        """
+        Evaluate the closed form for all offsets at once, returning them as a
+        NumPy array of 64-bit integers.
+        """
+        numpy = _numpy()
+        ks = numpy.arange(self._count + 1, dtype=numpy.int64)
+        offsets = ks * self._length + numpy.maximum(ks - self._shift, 0)
+        offsets[-1] = self._limit
+        return offsets
+
+def _numpy():
+    """
+    Import NumPy on demand so that importing this module remains inexpensive
+    (and so that NumPy remains an optional dependency).
+    """
+    try:
+        import numpy # pylint: disable=import-outside-toplevel
+    except ImportError: # pragma: no cover
+        raise ImportError('NumPy must be installed to use this feature') from None
+    return numpy
+
+def _vectorized(offsets: Sequence[int]):
+    """
+    Return the supplied offsets (as obtained from :obj:`_offsets`) as a NumPy
+    array of 64-bit integers.
+    """
+    if isinstance(offsets, array):
+        numpy = _numpy()
+        return numpy.frombuffer(offsets, dtype=numpy.int64)
+    return offsets.vectorized()
+
+def _offsets(
+        size: int,
+        number: Optional[int] = None,
+        length: Union[int, Iterable[int], None] = None
+    ) -> Sequence[int]:
+    """
+    Determine the boundary offsets of all parts of an object having the
+    specified length, applying the same rules (and raising the same exceptions)
+    as :obj:`parts` does for objects that have a length. The ``k``-th part
+    spans the offsets at indices ``k`` and ``k + 1``.
+
+    >>> list(_offsets(7, 3))
+    [0, 2, 4, 7]
+    >>> list(_offsets(7, length=3))
+    [0, 3, 6, 7]
+    >>> list(_offsets(7, length=[3, 5]))
+    [0, 3, 7]
+    >>> list(_offsets(6, 2, 3))
+    [0, 3, 6]
+    >>> list(_offsets(6, 2, [2, 4]))
+    [0, 2, 6]
+    >>> list(_offsets(0, 3))
+    [0]
+    >>> list(_offsets(3, length=[3, 1]))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    """
+    # pylint: disable=too-many-branches
+    if number is not None and not isinstance(number, int):
+        raise TypeError('number parameter must be an integer')
+
+    if length is not None:
+        if not isinstance(length, int) and not isinstance(length, collections.abc.Iterable):
+            raise TypeError(
+                'length parameter must be an integer or iterable of integers'
+            )
+
+    if number is not None and length is None:
+        if size == 0:
+            return _Offsets(0, 0, 0, 0)
+        number = max(1, min(size, number)) # Number should be reasonable.
+        return _Offsets(number, size // number, number - (size % number), size)
+
+    if length is None: # Neither is specified.
+        raise ValueError('missing number of parts parameter and part length(s) parameter')
+
+    if isinstance(length, int):
+        length = max(1, length)
+        if number is not None:
+            if size > (length * number) or size <= (length * (number - 1)):
+                raise ValueError(
+                    'cannot retrieve ' + str(number) + ' parts from object ' + \
+                    'given part length parameter of ' + str(length)
+                )
+        count = -(-size // length)
+        return _Offsets(count, length, count, size)
+
+    offsets = array('q', [0])
+    if number is None: # Length can only be an iterable of integers.
+        for length_ in length:
+            if not isinstance(length_, int):
+                raise TypeError(
+                    'length parameter must be an integer or iterable of integers'
+                )
+            if offsets[-1] >= size or length_ <= 0:
+                raise ValueError(
+                    'object has too few items to retrieve parts having ' + \
+                    'specified part lengths'
+                )
+            offsets.append(min(offsets[-1] + length_, size))
+        return offsets
+
+    return _exact_offsets(size, number, length)
+
+def _integers(length: Iterable) -> Optional[Sequence[int]]:
+    """
+    Return a one-dimensional NumPy array of the entries in an :obj:`array.array`
+    instance or NumPy array of integers, or ``None`` if the supplied object is
+    not such an instance (or if NumPy is not available).
+    """
+    if isinstance(length, array) and length.typecode in 'bBhHiIlLqQ':
+        try:
+            return _numpy().frombuffer(length, dtype=length.typecode)
+        except ImportError: # pragma: no cover
+            return None
+
+    if 'numpy' in sys.modules and \
+       isinstance(length, sys.modules['numpy'].ndarray) and \
+       length.ndim == 1 and length.dtype.kind in 'iu':
+        return length
+
+    return None
+
+def _exact_offsets(size: int, number: int, length: Iterable[int]) -> Sequence[int]:
+    """
+    Determine the boundary offsets of the parts of an object having the
+    specified length when both the number of parts and an iterable of part
+    lengths are specified. The part lengths are validated in a single pass
+    (or using vectorized operations for arrays of integers).
+
+    >>> list(_exact_offsets(6, 3, (l for l in [1, 2, 3])))
+    [0, 1, 3, 6]
+    >>> list(_exact_offsets(6, 2, array('q', [2, 5])))
+    [0, 2, 6]
+    >>> import numpy
+    >>> list(_exact_offsets(6, 2, numpy.array([2, 4], dtype=numpy.uint8)))
+    [0, 2, 6]
+    >>> list(_exact_offsets(6, 3, numpy.array([2, 4])))
+    Traceback (most recent call last):
+      ...
+    ValueError: number parameter does not match number of specified part lengths
+    >>> list(_exact_offsets(6, 2, numpy.array([6, 1])))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    >>> list(_exact_offsets(6, 2, array('q', [2, 3])))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too many items to retrieve parts having specified part lengths
+
+    Offsets are the sums of the preceding part lengths (even if some lengths
+    are negative), so slicing an object using them yields the same parts as
+    earlier versions of this library.
+
+    >>> list(_exact_offsets(3, 3, [5, -3, 2]))
+    [0, 5, 2, 3]
+    >>> list(parts([0, 1, 2], 3, [5, -3, 2]))
+    [[0, 1, 2], [], [2]]
+    >>> list(parts([0, 1, 2, 3], 3, [5, -3, 2]))
+    [[0, 1, 2, 3], [], [2, 3]]
+    """
+    lengths = _integers(length)
+    if lengths is not None and (len(lengths) == 0 or lengths.min() >= 0):
+        numpy = _numpy()
+        sums = numpy.cumsum(lengths, dtype=numpy.int64)
+        (count, total) = (len(sums), int(sums[-1]) if len(sums) > 0 else 0)
+        preceding = int(sums[-2]) if count > 1 else 0
+        offsets = array('q', [0])
+        offsets.frombytes(numpy.minimum(sums, size).astype('q').tobytes())
+    else:
+        (offsets, total) = (array('q', [0]), 0)
+        append = offsets.append
+        for length_ in length if lengths is None else lengths.tolist():
+            if not isinstance(length_, int):
+                raise TypeError(
+                    'length parameter must be an integer or list of integers'
+                )
+            total += length_
+            append(total)
+
+        count = len(offsets) - 1
+        preceding = offsets[-2] if count > 1 else 0
+        offsets[-1] = min(offsets[-1], size)
+
+    if count != number:
+        raise ValueError(
+            'number parameter does not match number of specified part lengths'
+        )
+
+    if size <= preceding:
+        raise ValueError(
+            'object has too few items to retrieve parts having ' + \
+            'specified part lengths'
+        )
+
+    if size > total:
+        raise ValueError(
+            'object has too many items to retrieve parts having ' + \
+            'specified part lengths'
+        )
+
+    return offsets
+
+def _weights(
+        iterable: Sequence,
+        weights: Union[Iterable[Union[int, float]], Callable]
+    ) -> List[Union[int, float]]:
+    """
+    Validate the weights parameter for an object (applying it to each item of
+    the object if it is a function) and return a list of weights.
+
+    >>> _weights(['a', 'bb', 'ccc'], len)
+    [1, 2, 3]
+    >>> _weights([1, 2], [1, 2, 3])
+    Traceback (most recent call last):
+      ...
+    ValueError: number of weights does not match number of items in object
+    >>> _weights([1, 2], [1, -2])
+    Traceback (most recent call last):
+      ...
+    ValueError: weights must be finite and non-negative
+    >>> _weights([1, 2], [1, float('nan')])
+    Traceback (most recent call last):
+      ...
+    ValueError: weights must be finite and non-negative
+    >>> _weights([1, 2], [float('inf'), 1])
+    Traceback (most recent call last):
+      ...
+    ValueError: weights must be finite and non-negative
+    >>> _weights([1, 2], ['a', 'b'])
+    Traceback (most recent call last):
+      ...
+    TypeError: weights parameter must be an iterable of numbers or a function
+    """
+    try:
+        size = len(iterable)
+    except TypeError:
+        raise TypeError(
+            'object must have length to determine parts from weights parameter'
+        ) from None
+
+    if callable(weights):
+        weights = [weights(item) for item in iterable]
+    elif isinstance(weights, collections.abc.Iterable):
+        # Arrays (such as NumPy arrays) can convert their entries all at once.
+        weights = weights.tolist() if hasattr(weights, 'tolist') else list(weights)
+    else:
+        raise TypeError('weights parameter must be an iterable of numbers or a function')
+
+    if len(weights) != size:
+        raise ValueError('number of weights does not match number of items in object')
+
+    for weight in weights:
+        if not isinstance(weight, (int, float)):
+            raise TypeError('weights parameter must be an iterable of numbers or a function')
+        if not 0 <= weight < math.inf: # Also false if the weight is NaN.
+            raise ValueError('weights must be finite and non-negative')
+
+    return weights
+
+def _weighted_offsets(weights: Sequence[Union[int, float]], number: int) -> Sequence[int]:
+    """
+    Determine the boundary offsets of the specified number of contiguous parts
+    such that the largest sum of the weights in any part is as small as
+    possible. The smallest feasible bound on the sum of a part is found using a
+    binary search; checking whether a bound is feasible requires one search
+    over the prefix sums of the weights for each part.
+
+    >>> list(_weighted_offsets([5, 1, 1, 1, 1, 1], 2))
+    [0, 1, 6]
+    >>> list(_weighted_offsets([1, 2, 3, 4, 5], 3))
+    [0, 3, 4, 5]
+    >>> list(_weighted_offsets([0.5, 0.25, 0.25, 1.0], 2))
+    [0, 3, 4]
+    >>> list(_weighted_offsets([0, 0, 0, 0], 3))
+    [0, 2, 3, 4]
+    >>> list(_weighted_offsets([], 3))
+    [0]
+    """
+    size = len(weights)
+    if size == 0:
+        return array('q', [0])
+    number = max(1, min(size, number)) # Number should be reasonable.
+    prefix = list(chain([0], accumulate(weights)))
+
+    def cuts(bound):
+        # Yield the end offset of each successive part, with each part having
+        # as many items as the bound allows (but leaving at least one item for
+        # each of the remaining parts).
+        start = 0
+        for remaining in range(number - 1, -1, -1):
+            end = bisect_right(prefix, prefix[start] + bound, start + 1) - 1
+            start = max(start + 1, min(end, size - remaining))
+            yield start
+            if start == size:
+                break
+
+    def feasible(bound):
+        return max(cuts(bound)) == size
+
+    (lower, upper) = (max(weights), prefix[-1])
+    if all(isinstance(weight, int) for weight in weights):
+        while lower < upper:
+            middle = (lower + upper) // 2
+            (lower, upper) = (lower, middle) if feasible(middle) else (middle + 1, upper)
+    else:
+        for _ in range(128):
+            middle = (lower + upper) / 2
+            if middle in (lower, upper):
+                break
+            (lower, upper) = (lower, middle) if feasible(middle) else (middle, upper)
+
+    offsets = array('q', [0])
+    offsets.extend(cuts(upper))
+    offsets[-1] = size
+    return offsets
+
+def _greedy(weights: Sequence[Union[int, float]], number: int) -> List[List[int]]:
+    """
+    Assign the indices of items to the specified number of (not necessarily
+    contiguous) parts by considering items in descending order of weight and
+    assigning each item to the part having the smallest sum of weights (*i.e.*,
+    the longest processing time first rule). The indices in each part are in
+    ascending order.
+
+    >>> _greedy([7, 5, 4, 3, 1], 2)
+    [[0, 3], [1, 2, 4]]
+    >>> _greedy([0, 0, 0], 3)
+    [[0], [1], [2]]
+    """
+    if len(weights) == 0:
+        return []
+    number = max(1, min(len(weights), number)) # Number should be reasonable.
+
+    # Ties between parts having the same sum are resolved in favor of the part
+    # having fewer items (so that every part receives at least one item).
+    heap = [(0, 0, k) for k in range(number)]
+    indices = [[] for _ in range(number)]
+    for i in sorted(range(len(weights)), key=weights.__getitem__, reverse=True):
+        (total, count, k) = heap[0]
+        indices[k].append(i)
+        heapq.heapreplace(heap, (total + weights[i], count + 1, k))
+
+    return [sorted(part) for part in indices]
+
+def _weighted(
+        iterable: Sequence,
+        number: Optional[int],
+        length: Union[int, Iterable[int], None],
+        weights: Union[Iterable[Union[int, float]], Callable, None],
+        strategy: str
+    ) -> Iterator:
+    """
+    Split an object into the specified number of parts using the weights of
+    its items (as described in the documentation for :obj:`parts`).
+    """
+    if number is None or length is not None:
+        raise ValueError('weights can only be used with number of parts parameter')
+
+    if weights is None:
+        raise ValueError('weights parameter must be specified for greedy strategy')
+
+    weights = _weights(iterable, weights)
+    if strategy == 'greedy':
+        for indices in _greedy(weights, number):
+            yield [iterable[i] for i in indices]
+    else:
+        offsets = _weighted_offsets(weights, number)
+        for (lower, upper) in zip(offsets, islice(offsets, 1, None)):
+            yield iterable[lower:upper]
+
+def _interleaved(
+        iterable: Iterable,
+        number: Optional[int],
+        length: Union[int, Iterable[int], None],
+        weights: Union[Iterable[Union[int, float]], Callable, None]
+    ) -> Iterator:
+    """
+    Split an object into the specified number of parts such that each part
+    consists of every item at a position that is congruent to the index of
+    that part modulo the number of parts (as described in the documentation for
+    :obj:`parts`).
+    """
+    if number is None or length is not None or weights is not None:
+        raise ValueError(
+            'interleave strategy can only be used with number of parts parameter'
+        )
+
+    size = _sliceable(iterable)
+    if size is not None:
+        number = max(1, min(size, number))
+        for i in range(number if size > 0 else 0):
+            yield iterable[i::number]
+    else:
+        number = max(1, number)
+        for (i, iterator) in enumerate(itertools.tee(iterable, number)):
+            yield islice(iterator, i, None, number)
+
+def _prefetched(iterator: Iterator, prefetch: int) -> Iterator:
+    """
+    Retrieve the items of an iterator of parts on a background thread, keeping
+    up to the specified number of parts ahead of the consumer. Parts that are
+    iterators are retrieved as :obj:`list` instances (as all such parts depend
+    on the same underlying iterator). An exception raised while retrieving a
+    part is raised again when that part would have been yielded.
+    """
+    entries = queue.Queue(prefetch)
+    (stop, end) = (threading.Event(), object())
+
+    def put(entry) -> bool:
+        # Block only until the consumer stops retrieving parts.
+        while not stop.is_set():
+            try:
+                entries.put(entry, timeout=0.05)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        # Any exception (including :obj:`KeyboardInterrupt`) is forwarded, and
+        # the consumer always receives a final entry (so it never blocks).
+        try:
+            for part in iterator:
+                if not isinstance(part, collections.abc.Sized):
+                    part = list(part)
+                if not put((part, None)):
+                    return
+        except BaseException as e: # pylint: disable=broad-exception-caught
+            put((None, e))
+        finally:
+            put(end)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            entry = entries.get()
+            if entry is end:
+                break
+            (part, exception) = entry
+            if exception is not None:
+                raise exception
+            yield part
+            del part, entry # Do not retain parts that are no longer needed.
+    finally:
+        stop.set()
+        try:
+            while True: # Release any parts that are already retrieved.
+                entries.get_nowait()
+        except queue.Empty:
+            pass
+
 def parts(
         iterable: Iterable,
         number: Optional[int] = None,
-        length: Union[int, Iterable[int], None] = None
+        length: Union[int, Iterable[int], None] = None,
+        *,
+        view: bool = False,
+        axis: Optional[int] = None,
+        weights: Union[Iterable[Union[int, float]], Callable, None] = None,
+        strategy: str = 'contiguous',
+        materialize: Optional[type] = None,
+        prefetch: Optional[int] = None,
+        stats: Optional[Statistics] = None
     ) -> Iterable:
     """
     This function splits an :obj:`~collections.abc.Iterable` object into either
@@ -64,6 +803,18 @@ def parts(
     :param iterable: Iterable to split into parts.
     :param number: Number of parts.
     :param length: Length of every part or iterable of part lengths.
+    :param view: Whether to return views of the parts rather than copies.
+    :param axis: Axis along which to split an array (such as a NumPy array).
+    :param weights: Weight of each item or function that returns the weight
+        of an item.
+    :param strategy: Strategy for assigning items to parts (either
+        ``'contiguous'``, ``'greedy'``, or ``'interleave'``).
+    :param materialize: Type (either :obj:`tuple` or :obj:`list`) of every
+        part, if the parts should be materialized.
+    :param prefetch: Number of parts to retrieve in advance on a background
+        thread.
+    :param stats: :obj:`~parts.statistics.Statistics` instance in which to
+        record statistics about the retrieved parts.
 
     In the simplest case, the target number of parts can be specified.
 
@@ -114,6 +865,11 @@ def parts(
     [[1, 2], [3, 4], [5, 6]]
     >>> list(parts([1, 2, 3, 4, 5, 6], length=[1, 2, 3]))
     [[1], [2, 3], [4, 5, 6]]
+    >>> from array import array
+    >>> list(parts([1, 2, 3, 4, 5, 6], 3, array('q', [1, 2, 3])))
+    [[1], [2, 3], [4, 5, 6]]
+    >>> list(parts([1, 2, 3, 4, 5, 6], 2, (l for l in [4, 2])))
+    [[1, 2, 3, 4], [5, 6]]
 
     The type of input objects (for built-in types) is preserved in the output.
 
@@ -252,6 +1008,192 @@ parts having specified length(s) can be retrieved
       ...
     TypeError: object does not support retrieval of slices
 
+    Parts can instead be materialized as :obj:`tuple` or :obj:`list` instances
+    (regardless of the type of the input). When the input is an iterator and
+    part lengths are specified, each part is retrieved with a single batching
+    operation (such as :obj:`itertools.batched`) rather than being wrapped in
+    several lazy iterators, which is substantially faster.
+
+    >>> list(parts(iterable(), length=4, materialize=tuple))
+    [(0, 1, 2, 3), (4, 5, 6, 7), (8, 9)]
+    >>> list(parts(iterable(), length=[3, 7], materialize=list))
+    [[0, 1, 2], [3, 4, 5, 6, 7, 8, 9]]
+    >>> list(parts('abcde', 2, materialize=tuple))
+    [('a', 'b'), ('c', 'd', 'e')]
+    >>> list(parts(iterable(), length=[3, 7, 1], materialize=list))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    >>> list(parts(iterable(), length=3, materialize=set))
+    Traceback (most recent call last):
+      ...
+    ValueError: materialize parameter must be tuple or list
+
+    When retrieving items is slow (such as when the items are retrieved over a
+    network by a generator), parts can be retrieved on a background thread
+    while the consumer processes earlier parts. At most the specified number of
+    parts are retrieved in advance. Parts of iterators are :obj:`list`
+    instances in this case and any exception raised while retrieving a part is
+    raised when that part would have been yielded.
+
+    >>> import time
+    >>> def pages():
+    ...     for i in range(10):
+    ...         time.sleep(0.001)
+    ...         yield i
+    >>> list(parts(pages(), length=4, prefetch=2))
+    [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    >>> list(parts('abcdefg', 3, prefetch=1))
+    ['ab', 'cd', 'efg']
+    >>> def failing():
+    ...     yield from range(5)
+    ...     raise RuntimeError('error in generator')
+    >>> ps = parts(failing(), length=2, prefetch=3)
+    >>> (next(ps), next(ps))
+    ([0, 1], [2, 3])
+    >>> next(ps)
+    Traceback (most recent call last):
+      ...
+    RuntimeError: error in generator
+    >>> def exiting():
+    ...     yield from range(3)
+    ...     raise SystemExit('exit in generator')
+    >>> list(parts(exiting(), length=1, prefetch=1))
+    Traceback (most recent call last):
+      ...
+    SystemExit: exit in generator
+    >>> list(parts(pages(), length=4, prefetch=0))
+    Traceback (most recent call last):
+      ...
+    ValueError: prefetch parameter must be a positive integer
+
+    Parts can be returned as views that refer to the entries of the original
+    object instead of copying them. Parts of objects that support the buffer
+    protocol (such as :obj:`bytes` and :obj:`bytearray` instances) are
+    :obj:`memoryview` instances and parts of :obj:`list` and :obj:`tuple`
+    instances are :obj:`SequenceView` instances. Other objects are sliced as
+    usual.
+
+    >>> data = bytearray(b'abcdefg')
+    >>> ps = list(parts(data, 2, view=True))
+    >>> [bytes(p) for p in ps]
+    [b'abc', b'defg']
+    >>> all(isinstance(p, memoryview) and p.obj is data for p in ps)
+    True
+    >>> data[0] = ord('z')
+    >>> bytes(ps[0])
+    b'zbc'
+    >>> [bytes(p) for p in parts(bytes(range(5)), length=2, view=True)]
+    [b'\\x00\\x01', b'\\x02\\x03', b'\\x04']
+    >>> [bytes(p) for p in parts(bytes(range(5)), length=[1, 4], view=True)]
+    [b'\\x00', b'\\x01\\x02\\x03\\x04']
+    >>> [p.tolist() for p in parts(data, number=2, length=[3, 4], view=True)]
+    [[122, 98, 99], [100, 101, 102, 103]]
+    >>> xs = [[1], [2], [3], [4], [5]]
+    >>> ps = list(parts(xs, 2, view=True))
+    >>> ps
+    [SequenceView([[1], [2]]), SequenceView([[3], [4], [5]])]
+    >>> ps[0][0] is xs[0]
+    True
+    >>> xs[1] = [20]
+    >>> ps[0]
+    SequenceView([[1], [20]])
+    >>> list(parts(xs, length=2, view=True))
+    [SequenceView([[1], [20]]), SequenceView([[3], [4]]), SequenceView([[5]])]
+    >>> list(parts(xs, length=[4, 1], view=True))
+    [SequenceView([[1], [20], [3], [4]]), SequenceView([[5]])]
+    >>> list(parts((1, 2, 3, 4), number=2, length=2, view=True))
+    [SequenceView((1, 2)), SequenceView((3, 4))]
+    >>> list(parts((1, 2, 3, 4), number=2, length=[1, 3], view=True))
+    [SequenceView((1,)), SequenceView((2, 3, 4))]
+    >>> list(parts('abcd', 2, view=True))
+    ['ab', 'cd']
+    >>> list(map(list, parts(iter([1, 2, 3]), length=2, view=True)))
+    [[1, 2], [3]]
+
+    Arrays can be split along any axis. Slices of NumPy arrays are always
+    views, so the parts of a NumPy array never copy its entries.
+
+    >>> import numpy
+    >>> a = numpy.arange(14).reshape((2, 7))
+    >>> [p.tolist() for p in parts(a, 3, axis=1)]
+    [[[0, 1], [7, 8]], [[2, 3], [9, 10]], [[4, 5, 6], [11, 12, 13]]]
+    >>> [p.shape for p in parts(a, length=4, axis=-1)]
+    [(2, 4), (2, 3)]
+    >>> [p.shape for p in parts(a, length=[2, 5], axis=1)]
+    [(2, 2), (2, 5)]
+    >>> [p.shape for p in parts(a, 2, [3, 4], axis=1)]
+    [(2, 3), (2, 4)]
+    >>> [p.tolist() for p in parts(a, 2)]
+    [[[0, 1, 2, 3, 4, 5, 6]], [[7, 8, 9, 10, 11, 12, 13]]]
+    >>> all(numpy.shares_memory(p, a) for p in parts(a, 3, axis=1))
+    True
+
+    When the items have different weights (such as the sizes of files that
+    must be processed), the weight of each item (or a function that returns
+    the weight of an item) can be specified along with the number of parts.
+    The items are then split into contiguous parts such that the largest sum
+    of the weights in any part is as small as possible.
+
+    >>> list(parts([5, 1, 1, 1, 1, 1], 2, weights=[5, 1, 1, 1, 1, 1]))
+    [[5], [1, 1, 1, 1, 1]]
+    >>> list(parts(['aaaa', 'b', 'c', 'dd', 'ee'], 3, weights=len))
+    [['aaaa'], ['b', 'c', 'dd'], ['ee']]
+    >>> list(parts('abcde', 2, weights=[0.5, 0.25, 0.25, 0.75, 0.25]))
+    ['abc', 'de']
+    >>> list(parts([1, 2, 3], 5, weights=[1, 1, 1]))
+    [[1], [2], [3]]
+
+    The ``'greedy'`` strategy assigns items (which are considered in descending
+    order of weight) to the part having the smallest sum of weights so far. The
+    parts are not contiguous, so each part is a :obj:`list` of the items that
+    were assigned to it (in their original order).
+
+    >>> list(parts([7, 5, 4, 3, 1], 2, weights=lambda x: x, strategy='greedy'))
+    [[7, 3], [5, 4, 1]]
+    >>> list(parts([7, 5, 4, 3, 1], 2, weights=lambda x: x))
+    [[7, 5], [4, 3, 1]]
+
+    The ``'interleave'`` strategy assigns the item at each position to the part
+    whose index is congruent to that position modulo the number of parts (so
+    the part at index ``i`` of a sequence ``xs`` is ``xs[i::number]``). The
+    types of sequences are preserved and parts of objects that support the
+    buffer protocol can be views. As with the default strategy, the lengths of
+    any two parts differ by at most one, but the longer parts come *first*
+    rather than last. Because every part contains items from the entire input,
+    the parts of a sorted input have similar sums.
+
+    >>> list(parts([1, 2, 3, 4, 5, 6, 7], 3, strategy='interleave'))
+    [[1, 4, 7], [2, 5], [3, 6]]
+    >>> list(parts([1, 2, 3, 4, 5, 6, 7], 3))
+    [[1, 2], [3, 4], [5, 6, 7]]
+    >>> list(parts(range(10), 4, strategy='interleave'))
+    [range(0, 10, 4), range(1, 10, 4), range(2, 10, 4), range(3, 10, 4)]
+    >>> [p.tobytes() for p in parts(b'abcdefg', 2, view=True, strategy='interleave')]
+    [b'aceg', b'bdf']
+    >>> list(parts([1, 2], 3, strategy='interleave'))
+    [[1], [2]]
+
+    The parts of an iterator are retrieved in a single pass over the iterator
+    (using :obj:`itertools.tee`), so the number of parts is always the specified
+    number (even if some parts are empty). Each item is retained until every
+    part has advanced past its position, so the memory required depends on the
+    order in which items are retrieved from the parts. Retrieving items from
+    all the parts in turn requires memory proportional to the number of parts,
+    but retrieving every item of one part before those of the next part
+    requires memory proportional to the number of items in the iterator.
+
+    >>> list(zip(*parts(iter(range(6)), 3, strategy='interleave')))
+    [(0, 1, 2), (3, 4, 5)]
+    >>> list(map(list, parts(iter(range(7)), 3, strategy='interleave')))
+    [[0, 3, 6], [1, 4], [2, 5]]
+    >>> list(map(list, parts(iter(range(2)), 3, strategy='interleave')))
+    [[0], [1], []]
+    >>> list(parts([1, 2, 3], length=2, strategy='interleave'))
+    Traceback (most recent call last):
+      ...
+    ValueError: interleave strategy can only be used with number of parts parameter
+
     A descriptive exception is raised when parameter values cannot be satisfied,
     cause a conflict, or have an incorrect type.
 
@@ -324,8 +1266,24 @@ parts having specified length(s) can be retrieved
     Traceback (most recent call last):
       ...
     TypeError: length parameter must be an integer or list of integers
+    >>> list(parts([1, 2, 3], length=2, weights=[1, 1, 1]))
+    Traceback (most recent call last):
+      ...
+    ValueError: weights can only be used with number of parts parameter
+    >>> list(parts([1, 2, 3], 2, strategy='greedy'))
+    Traceback (most recent call last):
+      ...
+    ValueError: weights parameter must be specified for greedy strategy
+    >>> list(parts([1, 2, 3], 2, strategy='random'))
+    Traceback (most recent call last):
+      ...
+    ValueError: strategy parameter must be 'contiguous', 'greedy', or 'interleave'
+    >>> list(parts(iter([1, 2, 3]), 2, weights=[1, 1, 1]))
+    Traceback (most recent call last):
+      ...
+    TypeError: object must have length to determine parts from weights parameter
     """
-    # pylint: disable=too-many-branches,too-many-statements
+    # pylint: disable=too-many-arguments,too-many-branches,too-many-statements,too-many-locals
     if number is not None and not isinstance(number, int):
         raise TypeError('number parameter must be an integer')
 
@@ -335,6 +1293,69 @@ parts having specified length(s) can be retrieved
                 'length parameter must be an integer or iterable of integers'
             )
 
+    if strategy not in ('contiguous', 'greedy', 'interleave'):
+        raise ValueError(
+            "strategy parameter must be 'contiguous', 'greedy', or 'interleave'"
+        )
+
+    if stats is not None:
+        stats.begin()
+        source = None
+        if isinstance(iterable, collections.abc.Iterator):
+            iterable = source = stats.source(iterable)
+        produced = parts(
+            iterable, number, length,
+            view=view, axis=axis, weights=weights, strategy=strategy,
+            materialize=materialize, prefetch=prefetch
+        )
+        while True:
+            (start, waited) = (time.perf_counter(), 0.0 if source is None else source.seconds)
+            try:
+                part = next(produced)
+            except StopIteration:
+                return
+            seconds = time.perf_counter() - start
+            if source is not None: # Time spent waiting on the source is recorded separately.
+                seconds = max(0.0, seconds - (source.seconds - waited))
+            yield stats.record(part, seconds)
+
+    if prefetch is not None:
+        if not isinstance(prefetch, int) or prefetch < 1:
+            raise ValueError('prefetch parameter must be a positive integer')
+
+        yield from _prefetched(parts(
+            iterable, number, length,
+            view=view, axis=axis, weights=weights, strategy=strategy,
+            materialize=materialize
+        ), prefetch)
+        return
+
+    if materialize is not None:
+        if materialize not in (tuple, list):
+            raise ValueError('materialize parameter must be tuple or list')
+
+        if isinstance(iterable, collections.abc.Iterator) and \
+           number is None and length is not None and weights is None:
+            yield from _batches(iterable, length, materialize)
+        else:
+            yield from map(materialize, parts(
+                iterable, number, length,
+                view=view, axis=axis, weights=weights, strategy=strategy
+            ))
+        return
+
+    iterable = _prepare(iterable, view, axis)
+    if axis is not None:
+        axis = iterable.axis # Use the normalized (non-negative) axis.
+
+    if strategy == 'interleave':
+        yield from _interleaved(iterable, number, length, weights)
+        return
+
+    if weights is not None or strategy == 'greedy':
+        yield from _weighted(iterable, number, length, weights, strategy)
+        return
+
     if number is not None and length is None:
         try:
             len_ = len(iterable)
@@ -368,7 +1389,7 @@ parts having specified length(s) can be retrieved
 
                 # The type of each part will match that of the original
                 # object to the extent that `_slice` can do so.
-                (part, empty) = _empty(part)
+                (part, empty) = _empty(part, axis)
                 if empty:
                     break
                 yield part
@@ -389,7 +1410,7 @@ parts having specified length(s) can be retrieved
 
                     # The type of each part will match that of the original
                     # object to the extent that `_slice` can do so.
-                    (part, empty) = _empty(part)
+                    (part, empty) = _empty(part, axis)
                     if empty:
                         raise ValueError(
                             'object has too few items to retrieve parts having ' + \
@@ -417,42 +1438,846 @@ parts having specified length(s) can be retrieved
                 )
             for i in range(0, len_, length): # Yield parts of specified length.
                 yield iterable[i:i + length]
-        elif (not isinstance(length, list)) or \
-             (not all(isinstance(l, int) for l in length)):
-            raise TypeError(
-                'length parameter must be an integer or list of integers'
+        else: # Length can only be an iterable of integers.
+            offsets = _exact_offsets(len_, number, length)
+            for (lower, upper) in zip(offsets, islice(offsets, 1, None)):
+                yield _slice(iterable, lower, upper)
+
+    else: # Neither is specified.
+        raise ValueError('missing number of parts parameter and part length(s) parameter')
+
+class Parts(collections.abc.Sequence):
+    """
+    Random-access :obj:`~collections.abc.Sequence` of the parts of an object
+    that has a length. The parts are identical to those yielded by
+    :obj:`parts` for the same arguments, but the boundaries of each part are
+    computed directly from its index (without producing any of the preceding
+    parts). Retrieving a part when either the number of parts or a single part
+    length is specified requires constant time.
+
+    :param iterable: Object (having a length) to split into parts.
+    :param number: Number of parts.
+    :param length: Length of every part or iterable of part lengths.
+    :param view: Whether to return views of the parts rather than copies.
+    :param axis: Axis along which to split an array (such as a NumPy array).
+
+    >>> ps = Parts([1, 2, 3, 4, 5, 6, 7], 3)
+    >>> len(ps)
+    3
+    >>> ps[0]
+    [1, 2]
+    >>> ps[-1]
+    [5, 6, 7]
+    >>> ps[1:]
+    [[3, 4], [5, 6, 7]]
+    >>> list(ps)
+    [[1, 2], [3, 4], [5, 6, 7]]
+    >>> ps[3]
+    Traceback (most recent call last):
+      ...
+    IndexError: part index out of range
+
+    The parts always match those yielded by :obj:`parts`.
+
+    >>> xs = list(range(23))
+    >>> all(
+    ...     list(Parts(xs, number)) == list(parts(xs, number))
+    ...     for number in range(1, 30)
+    ... )
+    True
+    >>> all(
+    ...     list(Parts(xs, length=length)) == list(parts(xs, length=length))
+    ...     for length in range(1, 30)
+    ... )
+    True
+    >>> Parts('abcdefg', length=[1, 2, 4])[1]
+    'bc'
+    >>> Parts(range(6), number=2, length=3)[-1]
+    range(3, 6)
+    >>> Parts(bytes(range(6)), number=2, length=[1, 5])[0]
+    b'\\x00'
+    >>> Parts(bytearray(range(6)), 2, view=True)[1].tolist()
+    [3, 4, 5]
+    >>> len(Parts([], 3))
+    0
+    >>> import numpy
+    >>> Parts(numpy.zeros((4, 10 ** 7)), 3, axis=1)[-1].shape
+    (4, 3333334)
+
+    Retrieving any individual part from a large object is inexpensive.
+
+    >>> ps = Parts(range(10 ** 8), 7)
+    >>> ps[5]
+    range(71428570, 85714285)
+    >>> ps[-1]
+    range(85714285, 100000000)
+
+    Exceptions are raised for invalid parameters (or objects that do not have
+    a length) when the instance is created.
+
+    >>> Parts(iter([1, 2, 3]), 2)
+    Traceback (most recent call last):
+      ...
+    TypeError: object must have length to retrieve parts by index
+    >>> Parts([1, 2, 3], 2, [1, 1])
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too many items to retrieve parts having specified part lengths
+    >>> Parts([1, 2, 3], length=[1.2])
+    Traceback (most recent call last):
+      ...
+    TypeError: length parameter must be an integer or iterable of integers
+    """
+    def __init__(
+            self,
+            iterable: Sequence,
+            number: Optional[int] = None,
+            length: Union[int, Iterable[int], None] = None,
+            *,
+            view: bool = False,
+            axis: Optional[int] = None
+        ):
+        self._iterable = _prepare(iterable, view, axis)
+        try:
+            size = len(self._iterable)
+        except TypeError:
+            raise TypeError('object must have length to retrieve parts by index') from None
+
+        self._offsets = PartitionPlan.cached(size, number, length).offsets
+
+    @classmethod
+    def _from_plan(cls, plan: PartitionPlan, iterable: Sequence) -> Parts:
+        """
+        Create an instance for an (already prepared) object using an existing
+        (already validated) partition plan.
+        """
+        parts_ = cls.__new__(cls)
+        parts_._iterable = iterable
+        parts_._offsets = plan.offsets
+        return parts_
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self[k] for k in range(len(self))[key]]
+
+        try:
+            k = range(len(self))[key]
+        except IndexError:
+            raise IndexError('part index out of range') from None
+
+        return self._iterable[self._offsets[k]:self._offsets[k + 1]]
+
+    def __iter__(self) -> Iterator:
+        for (lower, upper) in zip(self._offsets, islice(self._offsets, 1, None)):
+            yield self._iterable[lower:upper]
+
+class PartsIterator(collections.abc.Iterator):
+    """
+    Iterator of the parts of an iterable (such as an iterator) that has no
+    length, each having the specified length. The parts are the same as those
+    yielded by :obj:`parts` when only a length parameter is supplied, but each
+    part owns its range of items: any items in a part that are not consumed are
+    discarded when the next part is retrieved (rather than being included in
+    the next part).
+
+    :param iterable: Iterable to split into parts.
+    :param length: Length of every part or iterable of part lengths.
+
+    >>> ps = PartsIterator(iter(range(10)), 3)
+    >>> [next(part) for part in ps]
+    [0, 3, 6, 9]
+    >>> ps = PartsIterator(iter(range(10)), [2, 3, 5])
+    >>> [list(islice(part, 2)) for part in ps]
+    [[0, 1], [2, 3], [5, 6]]
+    >>> list(map(list, PartsIterator(iter(range(7)), 3)))
+    [[0, 1, 2], [3, 4, 5], [6]]
+
+    Any number of parts can be skipped without retrieving them. The items in
+    the skipped parts are consumed from the underlying iterator directly.
+
+    >>> ps = PartsIterator(iter(range(20)), 3)
+    >>> list(next(ps))
+    [0, 1, 2]
+    >>> ps.skip(4)
+    >>> list(next(ps))
+    [15, 16, 17]
+    >>> ps.skip(10)
+    >>> list(ps)
+    []
+    >>> ps = PartsIterator(iter(range(20)), [1, 2, 3, 4, 5])
+    >>> ps.skip(3)
+    >>> list(next(ps))
+    [6, 7, 8, 9]
+    >>> ps = PartsIterator(iter(range(3)), [2, 2, 2])
+    >>> ps.skip(2)
+    >>> list(ps)
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+
+    Parameters are validated in the same way (and raise the same exceptions) as
+    they are by :obj:`parts`.
+
+    >>> list(map(list, PartsIterator(iter(range(3)), [1, 1, 1, 1])))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    >>> list(map(list, PartsIterator(iter(range(3)), [1, -1])))
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    >>> PartsIterator(iter(range(3)), 1.5)
+    Traceback (most recent call last):
+      ...
+    TypeError: length parameter must be an integer or iterable of integers
+    >>> PartsIterator(iter(range(3)), 2).skip(-1)
+    Traceback (most recent call last):
+      ...
+    ValueError: number of parts to skip must be a non-negative integer
+    """
+    def __init__(self, iterable: Iterable, length: Union[int, Iterable[int]]):
+        self._lengths = _lengths(length)
+        self._fixed = length if isinstance(length, int) else None
+        self._iterator = iter(iterable)
+        self._part = None # Range of items of the most recently retrieved part.
+        self._exhausted = False
+
+    def _discard(self):
+        """
+        Consume any items in the most recently retrieved part that have not
+        been consumed.
+        """
+        if self._part is not None:
+            collections.deque(self._part, maxlen=0)
+            self._part = None
+
+    def __next__(self) -> Iterator:
+        self._discard()
+        if self._exhausted:
+            raise StopIteration
+
+        length = next(self._lengths)
+        self._part = islice(self._iterator, max(0, length))
+        (part, empty) = _empty(self._part)
+        if empty:
+            self._exhausted = True
+            if self._fixed is not None:
+                raise StopIteration
+            raise ValueError(
+                'object has too few items to retrieve parts having ' + \
+                'specified part lengths'
             )
-        else: # Length must be a list of integers.
-            if len(length) != number:
-                raise ValueError(
-                    'number parameter does not match number of specified part lengths'
-                )
 
-            if len_ <= sum(length[:-1]):
-                raise ValueError(
-                    'object has too few items to retrieve parts having ' + \
-                    'specified part lengths'
-                )
+        return part
 
-            if len_ > sum(length):
-                raise ValueError(
-                    'object has too many items to retrieve parts having ' + \
-                    'specified part lengths'
-                )
+    def skip(self, count: int):
+        """
+        Skip the specified number of parts (or all remaining parts if fewer
+        remain) without retrieving them. If an iterable of part lengths was
+        supplied, an exception is raised for a skipped part in the same way as
+        it would be if that part were retrieved.
+        """
+        if not isinstance(count, int) or count < 0:
+            raise ValueError('number of parts to skip must be a non-negative integer')
 
-            lengths = iter(length)
-            index = 0
-            while True:
+        self._discard()
+        if self._exhausted or count == 0:
+            return
+
+        if self._fixed is None:
+            # Every skipped part must be non-empty (as must every retrieved part).
+            for _ in range(count):
                 try:
-                    length = next(lengths)
-                    part = _slice(iterable, index, index + length)
-                    index += length
-                    yield part
+                    next(self)
                 except StopIteration:
                     break
+            self._discard()
+            return
 
-    else: # Neither is specified.
-        raise ValueError('missing number of parts parameter and part length(s) parameter')
+        total = count * max(1, self._fixed)
+        if next(islice(self._iterator, total - 1, None), self) is self:
+            self._exhausted = True # Fewer items remained than were skipped.
+
+_CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+class _PlanCache:
+    """
+    Thread-safe least-recently-used cache of partition plans that keeps track
+    of hits and misses.
+    """
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, create):
+        """
+        Retrieve the plan having the specified key, creating it (and evicting
+        the least recently used plan if necessary) if it is not present.
+        """
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self.hits += 1
+                self._plans.move_to_end(key)
+                return plan
+            self.misses += 1
+
+        plan = create()
+        with self._lock:
+            self._plans[key] = plan
+            self._evict()
+        return plan
+
+    def resize(self, maxsize: int):
+        """
+        Change the maximum number of cached plans.
+        """
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self):
+        """
+        Remove all plans and reset the statistics.
+        """
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> _CacheInfo:
+        """
+        Return the cache statistics.
+        """
+        with self._lock:
+            return _CacheInfo(self.hits, self.misses, self.maxsize, len(self._plans))
+
+    def _evict(self):
+        while len(self._plans) > max(0, self.maxsize):
+            self._plans.popitem(last=False)
+
+class PartitionPlan:
+    """
+    Partition plan for objects having a specific length. All parameters are
+    validated (and the boundaries of all parts are determined) once when the
+    plan is created, and the plan can then be applied to any object having
+    that length. The parts are identical to those yielded by :obj:`parts` for
+    the same arguments.
+
+    :param total: Length of the objects to which the plan applies.
+    :param number: Number of parts.
+    :param length: Length of every part or iterable of part lengths.
+
+    >>> plan = PartitionPlan(7, 3)
+    >>> len(plan)
+    3
+    >>> plan.bounds(-1)
+    (4, 7)
+    >>> list(plan)
+    [(0, 2), (2, 4), (4, 7)]
+
+    Applying a plan to an object returns a :obj:`Parts` instance.
+
+    >>> list(plan('abcdefg'))
+    ['ab', 'cd', 'efg']
+    >>> plan([1, 2, 3, 4, 5, 6, 7])[-1]
+    [5, 6, 7]
+    >>> list(plan(bytearray(b'abcdefg'), view=True))[0].tobytes()
+    b'ab'
+    >>> import numpy
+    >>> plan(numpy.zeros((2, 7)), axis=1)[0].shape
+    (2, 2)
+    >>> plan([1, 2, 3])
+    Traceback (most recent call last):
+      ...
+    ValueError: object length does not match length of partition plan
+    >>> plan(iter([1, 2, 3]))
+    Traceback (most recent call last):
+      ...
+    TypeError: object must have length to apply partition plan
+
+    Parameters are validated in the same way (and raise the same exceptions) as
+    they are by :obj:`parts`.
+
+    >>> list(PartitionPlan(6, 2, [2, 4]))
+    [(0, 2), (2, 6)]
+    >>> PartitionPlan(6, 2, [2, 3])
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too many items to retrieve parts having specified part lengths
+    >>> PartitionPlan('abc', 2)
+    Traceback (most recent call last):
+      ...
+    TypeError: total parameter must be an integer
+    >>> PartitionPlan(-5, 3)
+    Traceback (most recent call last):
+      ...
+    ValueError: total parameter must be non-negative
+
+    Plans for frequently occurring parameters can be retrieved from a
+    least-recently-used cache (which is also used by :obj:`Parts`).
+
+    >>> PartitionPlan.cache_clear()
+    >>> PartitionPlan.cached(7, 3) is PartitionPlan.cached(7, 3)
+    True
+    >>> PartitionPlan.cached(7, length=[3, 4]) is PartitionPlan.cached(7, length=(3, 4))
+    True
+    >>> PartitionPlan.cached(7, length=[3, 4]) is PartitionPlan.cached(7, length=[3, 4])
+    True
+    >>> PartitionPlan.cache_info()
+    CacheInfo(hits=4, misses=2, maxsize=128, currsize=2)
+    >>> PartitionPlan.cache_resize(1)
+    >>> PartitionPlan.cache_info()
+    CacheInfo(hits=4, misses=2, maxsize=1, currsize=1)
+    >>> PartitionPlan.cache_resize(128)
+    >>> PartitionPlan.cached(7, number=2, length=[7, 1])
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    >>> PartitionPlan.cached(7, number=1, length=[[7]])
+    Traceback (most recent call last):
+      ...
+    TypeError: length parameter must be an integer or list of integers
+    >>> PartitionPlan.cache_info()
+    CacheInfo(hits=4, misses=3, maxsize=128, currsize=1)
+
+    Parameters that are equal to integers but are not integers are validated
+    even if a plan for the equal integers is in the cache.
+
+    >>> list(Parts([1, 2, 3, 4], 2))
+    [[1, 2], [3, 4]]
+    >>> Parts([1, 2, 3, 4], 2.0)
+    Traceback (most recent call last):
+      ...
+    TypeError: number parameter must be an integer
+    >>> list(Parts([1, 2, 3, 4], length=2))
+    [[1, 2], [3, 4]]
+    >>> Parts([1, 2, 3, 4], length=2.0)
+    Traceback (most recent call last):
+      ...
+    TypeError: length parameter must be an integer or iterable of integers
+    >>> PartitionPlan.cache_clear()
+    """
+    _cache = _PlanCache(128)
+
+    def __init__(
+            self,
+            total: int,
+            number: Optional[int] = None,
+            length: Union[int, Iterable[int], None] = None
+        ):
+        if not isinstance(total, int):
+            raise TypeError('total parameter must be an integer')
+        if total < 0:
+            raise ValueError('total parameter must be non-negative')
+
+        self.total = total
+        self.offsets = _offsets(total, number, length)
+
+    @classmethod
+    def cached(
+            cls,
+            total: int,
+            number: Optional[int] = None,
+            length: Union[int, Iterable[int], None] = None
+        ) -> PartitionPlan:
+        """
+        Retrieve a plan for the specified parameters from the cache (creating
+        and caching it if it is not present).
+        """
+        # pylint: disable=unidiomatic-typecheck
+        # Parameters that are equal to (but are not) integers (such as ``2.0``)
+        # must not match a cached plan, so they are validated by a new plan.
+        if type(total) is not int or (number is not None and type(number) is not int):
+            return cls(total, number, length)
+
+        if length is not None and not isinstance(length, int) and \
+           isinstance(length, collections.abc.Iterable):
+            integers = _integers(length)
+            if integers is not None:
+                key = (total, number, integers.dtype.str, integers.tobytes())
+            else:
+                # An iterator of part lengths can only be consumed once.
+                length = tuple(length)
+                if not all(type(l) is int for l in length):
+                    return cls(total, number, length)
+                key = (total, number, length)
+        elif length is None or type(length) is int:
+            key = (total, number, length)
+        else:
+            return cls(total, number, length)
+
+        return cls._cache.get(key, lambda: cls(total, number, length))
+
+    @classmethod
+    def cache_info(cls) -> _CacheInfo:
+        """
+        Return the hit and miss statistics, the maximum size, and the current
+        size of the cache.
+        """
+        return cls._cache.info()
+
+    @classmethod
+    def cache_clear(cls):
+        """
+        Remove all plans from the cache and reset its statistics.
+        """
+        cls._cache.clear()
+
+    @classmethod
+    def cache_resize(cls, maxsize: int):
+        """
+        Change the maximum number of plans in the cache (evicting the least
+        recently used plans if necessary).
+        """
+        cls._cache.resize(maxsize)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.offsets, islice(self.offsets, 1, None))
+
+    def bounds(self, index: int) -> Tuple[int, int]:
+        """
+        Return the lower and upper offsets of the part at the specified index.
+        """
+        try:
+            k = range(len(self))[index]
+        except IndexError:
+            raise IndexError('part index out of range') from None
+        return (self.offsets[k], self.offsets[k + 1])
+
+    def __call__(
+            self,
+            iterable: Sequence,
+            *,
+            view: bool = False,
+            axis: Optional[int] = None
+        ) -> Parts:
+        """
+        Apply this plan to an object that has the length of this plan (along
+        the specified axis, if one is specified).
+        """
+        iterable = _prepare(iterable, view, axis)
+        try:
+            size = len(iterable)
+        except TypeError:
+            raise TypeError('object must have length to apply partition plan') from None
+
+        if size != self.total:
+            raise ValueError('object length does not match length of partition plan')
+
+        return Parts._from_plan(self, iterable) # pylint: disable=protected-access
+
+def part_bounds(
+        total: int,
+        number: Optional[int] = None,
+        length: Union[int, Iterable[int], None] = None,
+        *,
+        ndarray: bool = False
+    ) -> Sequence[int]:
+    """
+    Determine the boundary offsets of the parts that :obj:`parts` would yield
+    for an object of the specified length, without requiring the object itself.
+    The ``k``-th part spans the offsets at indices ``k`` and ``k + 1`` (so the
+    result has one more entry than there are parts). Parameters are validated
+    in the same way (and raise the same exceptions) as they are by
+    :obj:`parts`.
+
+    :param total: Length of the object to split into parts.
+    :param number: Number of parts.
+    :param length: Length of every part or iterable of part lengths.
+    :param ndarray: Whether to return a NumPy array rather than an array.
+
+    >>> part_bounds(7, 3)
+    array('q', [0, 2, 4, 7])
+    >>> part_bounds(7, length=2)
+    array('q', [0, 2, 4, 6, 7])
+    >>> part_bounds(7, length=[2, 5])
+    array('q', [0, 2, 7])
+    >>> part_bounds(7, number=2, length=[3, 4])
+    array('q', [0, 3, 7])
+    >>> part_bounds(0, 3)
+    array('q', [0])
+    >>> all(
+    ...     [list(range(10))[a:b] for (a, b) in zip(bs, bs[1:])] == \\
+    ...     list(parts(list(range(10)), number))
+    ...     for number in range(1, 12)
+    ...     for bs in [part_bounds(10, number)]
+    ... )
+    True
+
+    Offsets can be returned as a NumPy array of 64-bit integers. Offsets that
+    have a closed form are computed using vectorized operations.
+
+    >>> part_bounds(7, 3, ndarray=True).tolist()
+    [0, 2, 4, 7]
+    >>> part_bounds(7, 3, ndarray=True).dtype.name
+    'int64'
+    >>> part_bounds(7, length=[2, 5], ndarray=True).tolist()
+    [0, 2, 7]
+    >>> bs = part_bounds(10 ** 9, 10 ** 6, ndarray=True)
+    >>> (len(bs), bs[:3].tolist(), bs[-2:].tolist())
+    (1000001, [0, 1000, 2000], [999999000, 1000000000])
+
+    The same exceptions as those raised by :obj:`parts` are raised for invalid
+    parameters.
+
+    >>> part_bounds(7, number=3, length=2)
+    Traceback (most recent call last):
+      ...
+    ValueError: cannot retrieve 3 parts from object given part length parameter of 2
+    >>> part_bounds(3, length=[1, 1, 1, 1])
+    Traceback (most recent call last):
+      ...
+    ValueError: object has too few items to retrieve parts having specified part lengths
+    >>> part_bounds(3)
+    Traceback (most recent call last):
+      ...
+    ValueError: missing number of parts parameter and part length(s) parameter
+    >>> part_bounds(3.0, 2)
+    Traceback (most recent call last):
+      ...
+    TypeError: total parameter must be an integer
+    >>> part_bounds(-5, 3)
+    Traceback (most recent call last):
+      ...
+    ValueError: total parameter must be non-negative
+    >>> part_bounds(-5, length=2)
+    Traceback (most recent call last):
+      ...
+    ValueError: total parameter must be non-negative
+    """
+    if not isinstance(total, int):
+        raise TypeError('total parameter must be an integer')
+    if total < 0:
+        raise ValueError('total parameter must be non-negative')
+
+    offsets = _offsets(total, number, length)
+
+    if not ndarray:
+        return offsets if isinstance(offsets, array) else array('q', offsets)
+
+    return _vectorized(offsets)
+
+def parts_stacked(
+        iterable: Sequence,
+        number: Optional[int] = None,
+        length: Union[int, Iterable[int], None] = None,
+        axis: int = 0
+    ):
+    """
+    Split a NumPy array along the specified axis into parts that all have the
+    same length, returning a single view of the array in which the first axis
+    indexes the parts (so no entries are copied). The parts are identical to
+    those yielded by :obj:`parts` for the same arguments.
+
+    :param iterable: NumPy array to split into parts.
+    :param number: Number of parts.
+    :param length: Length of every part or iterable of part lengths.
+    :param axis: Axis along which to split the array.
+
+    >>> import numpy
+    >>> a = numpy.arange(12).reshape((2, 6))
+    >>> s = parts_stacked(a, 3, axis=1)
+    >>> s.shape
+    (3, 2, 2)
+    >>> s.tolist()
+    [[[0, 1], [6, 7]], [[2, 3], [8, 9]], [[4, 5], [10, 11]]]
+    >>> all((s[k] == p).all() for (k, p) in enumerate(parts(a, 3, axis=1)))
+    True
+    >>> numpy.shares_memory(s, a)
+    True
+    >>> parts_stacked(a, length=1).shape
+    (2, 1, 6)
+    >>> parts_stacked(a, length=[3, 3], axis=-1).shape
+    (2, 2, 3)
+    >>> parts_stacked(numpy.arange(10 ** 7), 1000).shape
+    (1000, 10000)
+    >>> parts_stacked(a, 4, axis=1)
+    Traceback (most recent call last):
+      ...
+    ValueError: parts must have equal lengths to be stacked
+    """
+    numpy = _numpy()
+    along = _AxisView(iterable, axis)
+    offsets = PartitionPlan.cached(len(along), number, length).offsets
+    lengths = numpy.diff(_vectorized(offsets))
+    if len(lengths) > 0 and (lengths != lengths[0]).any():
+        raise ValueError('parts must have equal lengths to be stacked')
+
+    length = int(lengths[0]) if len(lengths) > 0 else 0
+    iterable = numpy.asarray(iterable)
+    (shape, strides) = (list(iterable.shape), list(iterable.strides))
+    shape[along.axis] = length
+    return numpy.lib.stride_tricks.as_strided(
+        iterable,
+        shape=[len(lengths)] + shape,
+        strides=[strides[along.axis] * length] + strides
+    )
+
+def parts_columns(
+        columns: Union[collections.abc.Mapping, Sequence],
+        number: Optional[int] = None,
+        length: Union[int, Iterable[int], None] = None,
+        *,
+        view: bool = False
+    ) -> Iterator[Union[dict, tuple]]:
+    """
+    Split a collection of columns that all have the same length into parts
+    such that the parts of all the columns are aligned. Each column is split in
+    the same way that :obj:`parts` would split it, but the part boundaries are
+    computed only once. The parts of a :obj:`dict` of columns are :obj:`dict`
+    instances and the parts of a sequence of columns are :obj:`tuple`
+    instances.
+
+    :param columns: Mapping or sequence of columns to split into parts.
+    :param number: Number of parts.
+    :param length: Length of every part or iterable of part lengths.
+    :param view: Whether to return views of the parts rather than copies.
+
+    >>> columns = {'id': [1, 2, 3, 4, 5], 'name': 'abcde', 'flag': bytes(5)}
+    >>> for part in parts_columns(columns, 2):
+    ...     part
+    {'id': [1, 2], 'name': 'ab', 'flag': b'\\x00\\x00'}
+    {'id': [3, 4, 5], 'name': 'cde', 'flag': b'\\x00\\x00\\x00'}
+    >>> list(parts_columns([range(4), (5, 6, 7, 8)], length=[3, 1]))
+    [(range(0, 3), (5, 6, 7)), (range(3, 4), (8,))]
+    >>> import numpy
+    >>> ps = list(parts_columns((numpy.arange(6), bytearray(6)), length=4, view=True))
+    >>> [(a.tolist(), b.nbytes) for (a, b) in ps]
+    [([0, 1, 2, 3], 4), ([4, 5], 2)]
+    >>> list(parts_columns({}, 2))
+    []
+
+    Columns that do not all have the same length are rejected.
+
+    >>> list(parts_columns({'a': [1, 2, 3], 'b': [1, 2]}, 2))
+    Traceback (most recent call last):
+      ...
+    ValueError: columns must all have the same length
+    >>> list(parts_columns([[1, 2, 3], iter([1, 2, 3])], 2))
+    Traceback (most recent call last):
+      ...
+    TypeError: columns must all have lengths
+    """
+    if isinstance(columns, collections.abc.Mapping):
+        (keys, columns) = (list(columns.keys()), list(columns.values()))
+    else:
+        (keys, columns) = (None, list(columns))
+
+    try:
+        sizes = set(len(column) for column in columns)
+    except TypeError:
+        raise TypeError('columns must all have lengths') from None
+
+    if len(sizes) > 1:
+        raise ValueError('columns must all have the same length')
+
+    offsets = PartitionPlan.cached(sizes.pop() if sizes else 0, number, length).offsets
+    if len(columns) == 0:
+        return
+
+    columns = [_prepare(column, view, None) for column in columns]
+    for (lower, upper) in zip(offsets, islice(offsets, 1, None)):
+        bundle = tuple(column[lower:upper] for column in columns)
+        yield bundle if keys is None else dict(zip(keys, bundle))
+
+def windows(
+        iterable: Iterable,
+        length: int,
+        step: int = 1,
+        *,
+        view: bool = False,
+        axis: Optional[int] = None
+    ) -> Iterator:
+    """
+    Yield the (possibly overlapping) parts of an :obj:`~collections.abc.Iterable`
+    object that each have the specified length and that start at every
+    multiple of the specified step. Only complete parts are yielded.
+
+    :param iterable: Iterable from which to retrieve parts.
+    :param length: Length of every part.
+    :param step: Distance between the starting positions of consecutive parts.
+    :param view: Whether to return views of the parts rather than copies.
+    :param axis: Axis along which to retrieve parts of an array (such as a
+        NumPy array).
+
+    >>> list(windows([1, 2, 3, 4, 5], 3))
+    [[1, 2, 3], [2, 3, 4], [3, 4, 5]]
+    >>> list(windows('abcdefg', 3, 2))
+    ['abc', 'cde', 'efg']
+    >>> list(windows(range(10), 2, 4))
+    [range(0, 2), range(4, 6), range(8, 10)]
+    >>> list(windows([1, 2], 3))
+    []
+
+    As with :obj:`parts`, parts can be views that refer to the entries of the
+    original object and arrays can be split along any axis.
+
+    >>> [bytes(w) for w in windows(bytearray(b'abcd'), 2, view=True)]
+    [b'ab', b'bc', b'cd']
+    >>> list(windows((1, 2, 3, 4), 3, view=True))
+    [SequenceView((1, 2, 3)), SequenceView((2, 3, 4))]
+    >>> import numpy
+    >>> [w.tolist() for w in windows(numpy.arange(8).reshape((2, 4)), 2, 2, axis=1)]
+    [[[0, 1], [4, 5]], [[2, 3], [6, 7]]]
+
+    The parts of an iterator (or of any other object that does not support
+    slicing) are :obj:`tuple` instances. Only the items in the current part are
+    retained, so memory usage does not depend on the number of items.
+
+    >>> list(windows(iter(range(6)), 3))
+    [(0, 1, 2), (1, 2, 3), (2, 3, 4), (3, 4, 5)]
+    >>> list(windows(iter(range(10)), 2, 3))
+    [(0, 1), (3, 4), (6, 7)]
+    >>> list(windows({1, 2, 3}, 2))
+    [(1, 2), (2, 3)]
+
+    A descriptive exception is raised when parameter values are invalid.
+
+    >>> list(windows([1, 2, 3], 0))
+    Traceback (most recent call last):
+      ...
+    ValueError: length parameter must be a positive integer
+    >>> list(windows([1, 2, 3], 2, 1.5))
+    Traceback (most recent call last):
+      ...
+    ValueError: step parameter must be a positive integer
+    """
+    # pylint: disable=too-many-arguments
+    if not isinstance(length, int) or length < 1:
+        raise ValueError('length parameter must be a positive integer')
+
+    if not isinstance(step, int) or step < 1:
+        raise ValueError('step parameter must be a positive integer')
+
+    iterable = _prepare(iterable, view, axis)
+    size = _sliceable(iterable)
+    if size is not None:
+        for i in range(0, size - length + 1, step):
+            yield iterable[i:i + length]
+        return
+
+    iterator = iter(iterable)
+    window = collections.deque(islice(iterator, length), maxlen=length)
+    advance = min(step, length) # Number of new items in each part.
+    while len(window) == length:
+        yield tuple(window)
+        if step > length:
+            collections.deque(islice(iterator, step - length), maxlen=0)
+        items = tuple(islice(iterator, advance))
+        if len(items) < advance:
+            break
+        window.extend(items)
 
-if __name__ == '__main__':
-    doctest.testmod() # pragma: no cover
+if __name__ == '__main__': # pragma: no cover
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,218 @@
+"""
+Classes for collecting statistics about the retrieval of parts.
+"""
+from __future__ import annotations
+from typing import Any, Callable, Optional, Iterator
+import sys
+import struct
+import time
+import threading
+import logging
+import collections
+import collections.abc
+from array import array
+
+_POINTER = struct.calcsize('P')
+
+def _copied(part: Any) -> int:
+    """
+    Determine the number of bytes that were copied to create a part that is
+    a buffer (such as a :obj:`bytes` instance), a NumPy array, a :obj:`list`,
+    or a :obj:`tuple` (counting only the references for the latter two). This
+    is zero for views and lazy parts, and for parts of any other type.
+
+    >>> (_copied(b'abc'), _copied(memoryview(b'abc')), _copied([1, 2]) > 0)
+    (3, 0, True)
+    """
+    if isinstance(part, (bytes, bytearray, array)):
+        return len(part) * (part.itemsize if isinstance(part, array) else 1)
+
+    if isinstance(part, (list, tuple)):
+        return len(part) * _POINTER # References to the items are copied.
+
+    if 'numpy' in sys.modules and isinstance(part, sys.modules['numpy'].ndarray):
+        return 0 if part.base is not None else part.nbytes
+
+    return 0
+
+class _Source(collections.abc.Iterator): # pylint: disable=too-few-public-methods
+    """
+    Iterator that records the time spent retrieving the items of another
+    iterator (both in its own total and by invoking the supplied function).
+    """
+    def __init__(self, iterator: Iterator, waited: Callable[[float], Any]):
+        self._iterator = iterator
+        self._waited = waited
+        self.seconds = 0.0
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            return next(self._iterator)
+        finally:
+            seconds = time.perf_counter() - start
+            self.seconds += seconds
+            self._waited(seconds)
+
+class Statistics: # pylint: disable=too-many-instance-attributes
+    """
+    Collection of statistics about the parts retrieved by one or more
+    invocations of :obj:`~parts.parts.parts` to which an instance of this class
+    is supplied (as the ``stats`` parameter). Statistics can be updated by
+    multiple threads concurrently.
+
+    :param callback: Function to invoke (with a :obj:`dict` describing the
+        part) whenever a part is retrieved.
+
+    >>> from parts import parts
+    >>> stats = Statistics()
+    >>> list(parts(b'abcdefg', 3, stats=stats))
+    [b'ab', b'cd', b'efg']
+    >>> [stats.calls, stats.parts, stats.items, stats.copied]
+    [1, 3, 7, 7]
+    >>> _ = [list(part) for part in parts(iter(range(10)), length=4, stats=stats)]
+    >>> [stats.calls, stats.parts, stats.items, stats.copied]
+    [2, 6, 17, 7]
+    >>> sum(stats.histogram.values())
+    6
+    >>> stats.producing >= 0 and stats.waiting >= 0
+    True
+
+    The items of lazy parts (such as the parts of an iterator) are counted as
+    they are consumed, and the time spent retrieving items from an iterator is
+    recorded separately as the time spent waiting on the source of the items.
+
+    >>> stats = Statistics()
+    >>> part = next(parts(iter(range(10)), length=4, stats=stats))
+    >>> (next(part), next(part), stats.items)
+    (0, 1, 2)
+
+    Time spent waiting on the source of the items is not included in the time
+    spent producing the parts.
+
+    >>> import time
+    >>> def slow(count):
+    ...     for i in range(count):
+    ...         time.sleep(0.01)
+    ...         yield i
+    >>> stats = Statistics()
+    >>> list(parts(slow(6), length=3, materialize=list, stats=stats))
+    [[0, 1, 2], [3, 4, 5]]
+    >>> (stats.waiting >= 0.06, stats.producing < 0.01)
+    (True, True)
+
+    The statistics can be exported as a :obj:`dict` or to a logger. The
+    histogram maps the upper bound (in microseconds) of each range of durations
+    to the number of parts that took a duration in that range to produce.
+
+    >>> stats = Statistics()
+    >>> _ = list(parts([1, 2, 3], 2, stats=stats))
+    >>> d = stats.as_dict()
+    >>> sorted(d.keys())
+    ['calls', 'copied', 'histogram', 'items', 'parts', 'producing', 'waiting']
+    >>> stats.clear()
+    >>> stats.parts
+    0
+
+    A function can be supplied that is invoked for each part that is retrieved.
+
+    >>> events = []
+    >>> stats = Statistics(events.append)
+    >>> _ = list(parts(b'abcdefg', length=4, stats=stats))
+    >>> [(event['items'], event['copied']) for event in events]
+    [(4, 4), (3, 3)]
+    """
+    def __init__(self, callback: Optional[Callable[[dict], Any]] = None):
+        self.callback = callback
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """
+        Reset all statistics.
+        """
+        with self._lock:
+            self.calls = 0
+            self.parts = 0
+            self.items = 0
+            self.copied = 0
+            self.producing = 0.0
+            self.waiting = 0.0
+            self.histogram = collections.Counter()
+
+    def begin(self):
+        """
+        Record the start of an invocation.
+        """
+        with self._lock:
+            self.calls += 1
+
+    def _wait(self, seconds: float):
+        """
+        Record time spent waiting on the source of the items.
+        """
+        with self._lock:
+            self.waiting += seconds
+
+    def source(self, iterator: Iterator) -> _Source:
+        """
+        Wrap an iterator so that the time spent retrieving its items is
+        recorded. The returned iterator has a ``seconds`` attribute that holds
+        the time spent retrieving its items.
+        """
+        return _Source(iterator, self._wait)
+
+    def _count(self, part: Iterator) -> Iterator:
+        """
+        Count the items of a lazy part as they are retrieved.
+        """
+        for item in part:
+            with self._lock:
+                self.items += 1
+            yield item
+
+    def record(self, part: Any, seconds: float) -> Any:
+        """
+        Record the retrieval of a part that took the specified number of
+        seconds to produce, returning the part (which is wrapped so that its
+        items are counted as they are retrieved if it is lazy).
+        """
+        (sized, copied) = (isinstance(part, collections.abc.Sized), _copied(part))
+        items = len(part) if sized else None
+        with self._lock:
+            self.parts += 1
+            self.items += items or 0
+            self.copied += copied
+            self.producing += seconds
+            self.histogram[1 << int(seconds * 1000000).bit_length()] += 1
+
+        if self.callback is not None:
+            self.callback({'items': items, 'copied': copied, 'seconds': seconds})
+
+        return part if sized else self._count(part)
+
+    def as_dict(self) -> dict:
+        """
+        Return the statistics as a :obj:`dict`.
+        """
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'parts': self.parts,
+                'items': self.items,
+                'copied': self.copied,
+                'producing': self.producing,
+                'waiting': self.waiting,
+                'histogram': dict(sorted(self.histogram.items()))
+            }
+
+    def log(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        """
+        Emit the statistics (as a :obj:`dict`) to a logger (the ``parts``
+        logger by default).
+        """
+        (logger or logging.getLogger('parts')).log(level, 'statistics: %s', self.as_dict())
+
+if __name__ == '__main__': # pragma: no cover
+    import doctest
+    doctest.testmod()